@@ -0,0 +1,74 @@
+"""
+Microbenchmark for the cached user record encoding
+
+Compares payload size and per-call CPU time of the binary ``user_codec``
+format against the JSON encoding of the ``User`` dataclass it replaced.
+
+Usage:
+    DATABASE_URL=sqlite:// REDIS_URL=redis://localhost python scripts/benchmark_user_cache_codec.py
+"""
+import json
+import sys
+import time
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.domain.entities.user import User  # noqa: E402
+from src.infrastructure.cache.user_codec import decode_user, encode_user  # noqa: E402
+from src.infrastructure.database.types import uuid7  # noqa: E402
+
+ITERATIONS = 50000
+
+
+def json_encode(user: User) -> bytes:
+    data = asdict(user)
+    data["created_at"] = user.created_at.isoformat()
+    data["updated_at"] = user.updated_at.isoformat()
+    return json.dumps(data).encode("utf-8")
+
+
+def json_decode(payload: bytes) -> User:
+    data = json.loads(payload)
+    data["created_at"] = datetime.fromisoformat(data["created_at"])
+    data["updated_at"] = datetime.fromisoformat(data["updated_at"])
+    return User(**data)
+
+
+def measure(label: str, call) -> float:
+    """Run ``call`` repeatedly and print the mean CPU time per call"""
+    call()
+    start = time.process_time()
+    for _ in range(ITERATIONS):
+        call()
+    per_call = (time.process_time() - start) / ITERATIONS * 1e6
+    print(f"{label:<16} {per_call:8.2f} us/call")
+    return per_call
+
+
+def main() -> None:
+    now = datetime.utcnow()
+    user = User(
+        id=str(uuid7()),
+        email="benchmark.user@example.com",
+        username="benchmark_user",
+        full_name="Benchmark User",
+        password_hash="$2b$12$" + "x" * 53,
+        created_at=now,
+        updated_at=now,
+    )
+
+    json_payload = json_encode(user)
+    binary_payload = encode_user(user)
+    print(f"Payload size: json {len(json_payload)} B, binary {len(binary_payload)} B")
+
+    measure("json encode", lambda: json_encode(user))
+    measure("binary encode", lambda: encode_user(user))
+    measure("json decode", lambda: json_decode(json_payload))
+    measure("binary decode", lambda: decode_user(binary_payload))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import base64
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Generic, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Keyset position: (created_at, id) of the last row on the previous page
+Keyset = Tuple[datetime, str]
+
+
+@dataclass
+class Page(Generic[T]):
+    """A page of results with an opaque cursor for the next page"""
+
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(keyset: Keyset) -> str:
+    """
+    Encode a keyset position as an opaque URL-safe cursor
+
+    Args:
+        keyset: (created_at, id) of the last returned row
+
+    Returns:
+        Opaque cursor string
+    """
+    created_at, row_id = keyset
+    raw = json.dumps([created_at.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Keyset:
+    """
+    Decode an opaque cursor back into a keyset position
+
+    Args:
+        cursor: Cursor previously returned by encode_cursor
+
+    Returns:
+        (created_at, id) tuple
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), str(row_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+from src.domain.entities.user import User, UserSummary
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Claims needed to rebuild a UserSummary without a database lookup
+PROFILE_CLAIMS = ("sub", "email", "username", "name", "prv", "email_verified", "cat", "uat")
+
+
+def _to_micros(value: Optional[datetime]) -> Optional[int]:
+    return (value - _EPOCH) // _MICROSECOND if value is not None else None
+
+
+def _from_micros(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def user_claims(user: User) -> Dict[str, Any]:
+    """
+    Access token claims describing a user
+
+    ``name`` and ``email_verified`` follow OpenID Connect; ``prv`` is the auth
+    provider and ``cat``/``uat`` are created_at/updated_at in microseconds
+    since the epoch (UTC).
+
+    Args:
+        user: Authenticated user (tokens are only issued to active users)
+
+    Returns:
+        Claims to embed in the access token
+    """
+    return {
+        "sub": user.id,
+        "email": user.email,
+        "username": user.username,
+        "name": user.full_name,
+        "prv": user.auth_provider,
+        "email_verified": user.is_verified,
+        "cat": _to_micros(user.created_at),
+        "uat": _to_micros(user.updated_at),
+    }
+
+
+def summary_from_claims(payload: Dict[str, Any]) -> Optional[UserSummary]:
+    """
+    Rebuild the authenticated user from access token claims
+
+    Args:
+        payload: Verified token payload
+
+    Returns:
+        User summary, or None if the token predates embedded profile claims
+    """
+    if any(payload.get(claim) is None for claim in PROFILE_CLAIMS):
+        return None
+
+    return UserSummary(
+        id=payload["sub"],
+        email=payload["email"],
+        username=payload["username"],
+        full_name=payload["name"],
+        auth_provider=payload["prv"],
+        is_active=True,
+        is_verified=bool(payload["email_verified"]),
+        created_at=_from_micros(payload["cat"]),
+        updated_at=_from_micros(payload["uat"]),
+    )
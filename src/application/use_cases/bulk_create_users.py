@@ -0,0 +1,65 @@
+from typing import Dict, List, Set
+from injector import inject
+from src.domain.entities.user import User
+from src.domain.repositories.user_repository import BulkCreateResult, UserRepository
+
+
+class BulkCreateUsersUseCase:
+    """Use case for creating many users in one batch"""
+
+    @inject
+    def __init__(self, user_repository: UserRepository):
+        self.user_repository = user_repository
+
+    async def execute(
+        self, users: List[Dict[str, str]], chunk_size: int = 1000
+    ) -> BulkCreateResult:
+        """
+        Create a batch of users
+
+        Args:
+            users: Dictionaries with email, username and full_name
+            chunk_size: Number of rows per INSERT statement
+
+        Returns:
+            Created user entities and (batch index, reason) for each rejected row
+        """
+        outcome = BulkCreateResult()
+        seen_emails: Set[str] = set()
+        seen_usernames: Set[str] = set()
+        accepted: List[User] = []
+        positions: List[int] = []
+
+        # Reject duplicates inside the batch before touching the database;
+        # comparisons are case-insensitive to match the unique indexes
+        for index, data in enumerate(users):
+            email_key = data["email"].lower()
+            username_key = data["username"].lower()
+            if email_key in seen_emails:
+                outcome.conflicts.append((index, f"Duplicate email {data['email']} in batch"))
+                continue
+            if username_key in seen_usernames:
+                outcome.conflicts.append((index, f"Duplicate username {data['username']} in batch"))
+                continue
+
+            seen_emails.add(email_key)
+            seen_usernames.add(username_key)
+            accepted.append(
+                User(
+                    email=data["email"],
+                    username=data["username"],
+                    full_name=data["full_name"],
+                    is_active=True,
+                )
+            )
+            positions.append(index)
+
+        if accepted:
+            result = await self.user_repository.create_many(accepted, chunk_size=chunk_size)
+            outcome.created = result.created
+            outcome.conflicts.extend(
+                (positions[index], reason) for index, reason in result.conflicts
+            )
+
+        outcome.conflicts.sort()
+        return outcome
@@ -0,0 +1,24 @@
+from typing import AsyncIterator
+from injector import inject
+from src.domain.entities.user import UserSummary
+from src.domain.repositories.user_repository import UserRepository
+
+
+class ExportUsersUseCase:
+    """Use case for exporting all users"""
+
+    @inject
+    def __init__(self, user_repository: UserRepository):
+        self.user_repository = user_repository
+
+    def execute(self, batch_size: int = 1000) -> AsyncIterator[UserSummary]:
+        """
+        Stream every user in (created_at, id) order
+
+        Args:
+            batch_size: Number of rows fetched from the database per round trip
+
+        Returns:
+            Async iterator of user summaries
+        """
+        return self.user_repository.stream_all(batch_size=batch_size)
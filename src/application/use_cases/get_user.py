@@ -1,9 +1,29 @@
-from typing import Optional, List
+import uuid
+from dataclasses import dataclass, field
+from typing import List, Optional
 from injector import inject
-from src.domain.entities.user import User
+from src.core.config import settings
+from src.application.pagination import Page, decode_cursor, encode_cursor
+from src.domain.entities.user import User, UserSummary
 from src.domain.repositories.user_repository import UserRepository
 
 
+@dataclass
+class UserLookup:
+    """Result of resolving a batch of ids and emails"""
+
+    users: List[User] = field(default_factory=list)
+    missing_ids: List[str] = field(default_factory=list)
+    missing_emails: List[str] = field(default_factory=list)
+
+
+def _canonical_id(user_id: str) -> Optional[str]:
+    try:
+        return str(uuid.UUID(user_id))
+    except ValueError:
+        return None
+
+
 class GetUserUseCase:
     """Use case for retrieving users"""
 
@@ -23,6 +43,18 @@ class GetUserUseCase:
         """
         return await self.user_repository.get_by_id(user_id)
 
+    async def get_summary_by_id(self, user_id: str) -> Optional[UserSummary]:
+        """
+        Get the public fields of a user by ID
+
+        Args:
+            user_id: User ID (UUID)
+
+        Returns:
+            User summary if found, None otherwise
+        """
+        return await self.user_repository.get_summary_by_id(user_id)
+
     async def get_by_email(self, email: str) -> Optional[User]:
         """
         Get user by email
@@ -35,15 +67,66 @@ class GetUserUseCase:
         """
         return await self.user_repository.get_by_email(email)
 
-    async def get_all(self, skip: int = 0, limit: int = 100) -> List[User]:
+    async def get_many(
+        self, user_ids: Optional[List[str]] = None, emails: Optional[List[str]] = None
+    ) -> UserLookup:
         """
-        Get all users with pagination
+        Resolve users by id and/or email with one multi-get per key type
 
         Args:
-            skip: Number of records to skip
-            limit: Maximum number of records to return
+            user_ids: User IDs to look up
+            emails: Emails to look up (case-insensitive)
 
         Returns:
-            List of user entities
+            Users found (each at most once) and the ids and emails that matched nobody
         """
-        return await self.user_repository.get_all(skip=skip, limit=limit)
+        user_ids = user_ids or []
+        emails = emails or []
+
+        # Malformed ids cannot match a row, so only well-formed ones are queried
+        canonical = {user_id: _canonical_id(user_id) for user_id in user_ids}
+        ids = list(dict.fromkeys(value for value in canonical.values() if value))
+        by_id = await self.user_repository.get_many_by_ids(ids) if ids else []
+        by_email = await self.user_repository.get_many_by_emails(emails) if emails else []
+
+        found_ids = {user.id for user in by_id}
+        found_emails = {user.email.lower() for user in by_email}
+        users = list({user.id: user for user in by_id + by_email}.values())
+
+        return UserLookup(
+            users=users,
+            missing_ids=[user_id for user_id in user_ids if canonical[user_id] not in found_ids],
+            missing_emails=[email for email in emails if email.lower() not in found_emails],
+        )
+
+    async def get_page(
+        self, limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> Page[UserSummary]:
+        """
+        Get a page of users using keyset pagination
+
+        Args:
+            limit: Maximum number of records to return (capped server-side)
+            cursor: Opaque cursor from the previous page, None for the first page
+
+        Returns:
+            Page of user entities with the cursor for the next page
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        if limit is None:
+            limit = settings.PAGINATION_DEFAULT_LIMIT
+        limit = max(1, min(limit, settings.PAGINATION_MAX_LIMIT))
+        after = decode_cursor(cursor) if cursor else None
+
+        # Fetch one extra row to learn whether another page exists
+        users = await self.user_repository.get_page(limit=limit + 1, after=after)
+
+        next_cursor = None
+        if len(users) > limit:
+            users = users[:limit]
+            last = users[-1]
+            next_cursor = encode_cursor((last.created_at, last.id))
+
+        return Page(items=users, next_cursor=next_cursor)
@@ -1,5 +1,6 @@
 from typing import Dict
 from injector import inject
+from src.application.token_claims import user_claims
 from src.domain.repositories.user_repository import UserRepository
 from src.infrastructure.services.password_service import PasswordService
 from src.infrastructure.services.jwt_service import JWTService
@@ -32,6 +33,7 @@ class LoginUserUseCase:
 
         Raises:
             ValueError: If credentials are invalid
+            PasswordHashingBusy: If the password hashing pool is saturated
         """
         # Get user by email
         user = await self.user_repository.get_by_email(email)
@@ -43,7 +45,7 @@ class LoginUserUseCase:
             raise ValueError(f"Please login with {user.auth_provider}")
 
         # Verify password
-        if not user.password_hash or not self.password_service.verify_password(
+        if not user.password_hash or not await self.password_service.verify_password_async(
             password, user.password_hash
         ):
             raise ValueError("Invalid credentials")
@@ -53,9 +55,7 @@ class LoginUserUseCase:
             raise ValueError("Account is deactivated")
 
         # Generate tokens
-        token_data = {"sub": user.id, "email": user.email, "username": user.username}
-
-        access_token = self.jwt_service.create_access_token(token_data)
+        access_token = self.jwt_service.create_access_token(user_claims(user))
         refresh_token = self.jwt_service.create_refresh_token({"sub": user.id})
 
         return {
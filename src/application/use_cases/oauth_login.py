@@ -1,6 +1,7 @@
 from typing import Dict
 from injector import inject
 from src.domain.entities.user import User
+from src.application.token_claims import user_claims
 from src.domain.repositories.user_repository import UserRepository
 from src.infrastructure.services.jwt_service import JWTService
 
@@ -52,19 +53,9 @@ class OAuthLoginUseCase:
                 user.oauth_provider_id = provider_user_id
                 user = await self.user_repository.update(user)
         else:
-            # Create new user from OAuth data
-            username = email.split("@")[0]  # Generate username from email
-
-            # Check if username exists, append numbers if needed
-            counter = 1
-            original_username = username
-            while True:
-                existing = await self.user_repository.get_by_email(f"{username}@temp")
-                # Simple check, in production you'd have a get_by_username method
-                if not existing:
-                    break
-                username = f"{original_username}{counter}"
-                counter += 1
+            # Create new user from OAuth data, with a username derived from the
+            # email and numbered if already taken (john, john1, john2, ...)
+            username = await self.user_repository.next_available_username(email.split("@")[0])
 
             user = User(
                 email=email,
@@ -80,9 +71,7 @@ class OAuthLoginUseCase:
             user = await self.user_repository.create(user)
 
         # Generate tokens
-        token_data = {"sub": user.id, "email": user.email, "username": user.username}
-
-        access_token = self.jwt_service.create_access_token(token_data)
+        access_token = self.jwt_service.create_access_token(user_claims(user))
         refresh_token = self.jwt_service.create_refresh_token({"sub": user.id})
 
         return {
@@ -1,5 +1,6 @@
 from typing import Dict
 from injector import inject
+from src.application.token_claims import user_claims
 from src.domain.repositories.user_repository import UserRepository
 from src.infrastructure.services.jwt_service import JWTService
 
@@ -44,9 +45,7 @@ class RefreshTokenUseCase:
             raise ValueError("Account is deactivated")
 
         # Generate new tokens
-        token_data = {"sub": user.id, "email": user.email, "username": user.username}
-
-        access_token = self.jwt_service.create_access_token(token_data)
+        access_token = self.jwt_service.create_access_token(user_claims(user))
         new_refresh_token = self.jwt_service.create_refresh_token({"sub": user.id})
 
         return {
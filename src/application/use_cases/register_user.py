@@ -27,6 +27,7 @@ class RegisterUserUseCase:
 
         Raises:
             ValueError: If user with email already exists
+            PasswordHashingBusy: If the password hashing pool is saturated
         """
         # Check if user already exists
         existing_user = await self.user_repository.get_by_email(email)
@@ -34,7 +35,7 @@ class RegisterUserUseCase:
             raise ValueError(f"User with email {email} already exists")
 
         # Hash the password
-        password_hash = self.password_service.hash_password(password)
+        password_hash = await self.password_service.hash_password_async(password)
 
         # Create new user entity
         user = User(
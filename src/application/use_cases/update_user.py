@@ -0,0 +1,72 @@
+from dataclasses import replace
+from typing import Any, Dict, Optional
+from injector import inject
+from src.domain.entities.user import User
+from src.domain.repositories.user_repository import UserRepository
+from src.infrastructure.services.token_revocation_service import TokenRevocationService
+
+
+class UpdateUserUseCase:
+    """Use case for partially updating a user"""
+
+    @inject
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        token_revocation: Optional[TokenRevocationService] = None,
+    ):
+        self.user_repository = user_repository
+        self.token_revocation = token_revocation
+
+    async def execute(self, user_id: str, changes: Dict[str, Any]) -> Optional[User]:
+        """
+        Update only the provided fields of a user
+
+        Args:
+            user_id: User ID (UUID)
+            changes: Field names mapped to their new values
+
+        Returns:
+            Updated user entity, or None if the user does not exist
+
+        Raises:
+            ValueError: If a field is set to null, or the new email or username is already taken
+        """
+        null_fields = sorted(field for field, value in changes.items() if value is None)
+        if null_fields:
+            raise ValueError(f"Fields cannot be null: {', '.join(null_fields)}")
+
+        user = await self.user_repository.get_by_id(user_id)
+        if not user:
+            return None
+
+        # Only columns whose value actually changes are written
+        changes = {
+            field: value
+            for field, value in changes.items()
+            if not hasattr(user, field) or getattr(user, field) != value
+        }
+        if not changes:
+            return user
+
+        if "email" in changes:
+            existing_user = await self.user_repository.get_by_email(changes["email"])
+            if existing_user and existing_user.id != user.id:
+                raise ValueError(f"User with email {changes['email']} already exists")
+
+        if "username" in changes:
+            existing_user = await self.user_repository.get_by_username(changes["username"])
+            if existing_user and existing_user.id != user.id:
+                raise ValueError(f"User with username {changes['username']} already exists")
+
+        updated_at = await self.user_repository.update_fields(user.id, changes)
+        if updated_at is None:
+            return None
+        user = replace(user, **changes, updated_at=updated_at)
+
+        # Tokens embed the profile and its updated_at (see token_claims), so any
+        # change outdates them; deactivated users are not issued new ones
+        if self.token_revocation:
+            await self.token_revocation.revoke_user(user.id)
+
+        return user
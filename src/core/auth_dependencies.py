@@ -1,30 +1,73 @@
+import logging
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from redis.exceptions import RedisError
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional
+from typing import Any, Dict, Optional
 
-from src.core.dependencies import get_db
-from src.domain.entities.user import User
-from src.infrastructure.services.jwt_service import JWTService
-from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+from src.core.config import settings
+from src.core.dependencies import (
+    create_token_revocation_service,
+    create_user_repository,
+    get_db,
+    get_read_db,
+)
+from src.application.token_claims import summary_from_claims
+from src.domain.entities.user import UserSummary
+from src.infrastructure.services.jwt_service import get_jwt_service
 
 
+logger = logging.getLogger(__name__)
+
 security = HTTPBearer()
 
 
+async def _user_from_claims(payload: Dict[str, Any]) -> Optional[UserSummary]:
+    """
+    Authenticate from token claims alone, for AUTH_STATELESS_ENABLED
+
+    Returns None when the token lacks profile claims or ``iat``, or the
+    revocation store is unreachable, so the caller falls back to a database
+    lookup.
+
+    Raises:
+        HTTPException: If the user's tokens have been revoked
+    """
+    user = summary_from_claims(payload)
+    issued_at = payload.get("iat")
+    if user is None or not isinstance(issued_at, (int, float)):
+        return None
+
+    try:
+        revoked = await create_token_revocation_service().is_revoked(user.id, issued_at)
+    except RedisError:
+        logger.warning("Token revocation check failed, loading user instead", exc_info=True)
+        return None
+
+    if revoked:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
-) -> User:
+    read_db: AsyncSession = Depends(get_read_db),
+) -> UserSummary:
     """
     Get current authenticated user from JWT token
 
     Args:
         credentials: HTTP bearer token
         db: Database session
+        read_db: Read-only database session (replica when configured)
 
     Returns:
-        Current user entity
+        Current user summary
 
     Raises:
         HTTPException: If token is invalid or user not found
@@ -32,8 +75,7 @@ async def get_current_user(
     token = credentials.credentials
 
     # Verify token
-    jwt_service = JWTService()
-    payload = jwt_service.verify_token(token, token_type="access")
+    payload = get_jwt_service().verify_token(token, token_type="access")
 
     if not payload:
         raise HTTPException(
@@ -50,9 +92,14 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    if settings.AUTH_STATELESS_ENABLED:
+        user = await _user_from_claims(payload)
+        if user is not None:
+            return user
+
     # Get user from database
-    user_repository = UserRepositoryImpl(db)
-    user = await user_repository.get_by_id(user_id)
+    user_repository = create_user_repository(db, read_session=read_db)
+    user = await user_repository.get_summary_by_id(user_id)
 
     if not user:
         raise HTTPException(
@@ -67,7 +114,9 @@ async def get_current_user(
     return user
 
 
-async def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
+async def get_current_active_user(
+    current_user: UserSummary = Depends(get_current_user),
+) -> UserSummary:
     """
     Get current active user
 
@@ -85,7 +134,9 @@ async def get_current_active_user(current_user: User = Depends(get_current_user)
     return current_user
 
 
-async def get_current_verified_user(current_user: User = Depends(get_current_user)) -> User:
+async def get_current_verified_user(
+    current_user: UserSummary = Depends(get_current_user),
+) -> UserSummary:
     """
     Get current verified user
 
@@ -103,24 +154,26 @@ async def get_current_verified_user(current_user: User = Depends(get_current_use
     return current_user
 
 
-def get_optional_current_user(
+async def get_optional_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
     db: AsyncSession = Depends(get_db),
-) -> Optional[User]:
+    read_db: AsyncSession = Depends(get_read_db),
+) -> Optional[UserSummary]:
     """
     Get current user if token is provided, otherwise None
 
     Args:
         credentials: Optional HTTP bearer token
         db: Database session
+        read_db: Read-only database session (replica when configured)
 
     Returns:
-        Current user entity or None
+        Current user summary or None
     """
     if not credentials:
         return None
 
     try:
-        return get_current_user(credentials, db)
+        return await get_current_user(credentials, db, read_db)
     except HTTPException:
         return None
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Dict, Optional
 
 
 class Settings(BaseSettings):
@@ -14,19 +14,65 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
     DB_ECHO: bool = False
+    DB_POOL_ENABLED: bool = True
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_WARMUP_SIZE: int = 5
+    DATABASE_REPLICA_URLS: list[str] = []
+    DB_REPLICA_MAX_LAG_SECONDS: float = 5.0
+    DB_REPLICA_LAG_CHECK_INTERVAL: float = 5.0
+    DB_QUERY_STATS_ENABLED: bool = True
+    DB_SLOW_QUERY_MS: float = 200.0
+    DB_QUERY_STATS_HEADERS: bool = False  # Add X-DB-Query-* headers to responses
+    DB_QUERY_BUDGET: int = 0  # Warn when a request issues more statements (0 disables)
 
     # Redis
     REDIS_URL: str
     REDIS_CACHE_TTL: int = 3600
+    USER_CACHE_ENABLED: bool = False
+    USER_NEGATIVE_CACHE_TTL: int = 60  # Seconds to remember lookups that found no user
+    # Probabilistic early refresh (0 disables, ~1 typical)
+    USER_CACHE_EARLY_REFRESH_BETA: float = 0.0
+    USER_SINGLE_FLIGHT_ENABLED: bool = True
+    USER_BATCHING_ENABLED: bool = False  # Batch concurrent get_by_id calls into IN queries
+    USER_BATCH_WINDOW_MS: float = 2.0
+    USER_BATCH_MAX_SIZE: int = 100
+    USER_LOCAL_CACHE_SIZE: int = 10000
+    USER_LOCAL_CACHE_TTL: float = 30.0  # In-process cache in front of Redis (0 disables)
+    USER_CACHE_INVALIDATION_CHANNEL: str = "user-cache-invalidation"
+
+    # Pagination
+    PAGINATION_DEFAULT_LIMIT: int = 50
+    PAGINATION_MAX_LIMIT: int = 100
+    EXPORT_BATCH_SIZE: int = 1000
+    BULK_IMPORT_MAX_ROWS: int = 50000
+    BULK_INSERT_CHUNK_SIZE: int = 1000
+    USER_LOOKUP_MAX_KEYS: int = 100
 
     # CORS
     CORS_ORIGINS: list[str] = ["*"]
 
     # JWT Authentication
     JWT_SECRET_KEY: str = "your-secret-key-change-in-production"
-    JWT_ALGORITHM: str = "HS256"
+    JWT_ALGORITHM: str = "HS256"  # HS256, or EdDSA/ES256 to publish keys via JWKS
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # Authenticate from access token claims plus a revocation check, without a user lookup
+    AUTH_STATELESS_ENABLED: bool = False
+    JWT_FAST_CODEC_ENABLED: bool = True  # Specialised HS256 codec instead of python-jose
+    JWT_VERIFY_CACHE_SIZE: int = 10000  # Verified tokens kept per worker (0 disables)
+    # EdDSA/ES256 keys as a JSON object of kid -> PEM (public-only PEMs verify but never sign)
+    JWT_SIGNING_KEYS: Dict[str, str] = {}
+    JWT_ACTIVE_KEY_ID: Optional[str] = None  # Defaults to the last key in JWT_SIGNING_KEYS
+    JWT_JWKS_MAX_AGE: int = 3600
+
+    # Password hashing (bcrypt runs on a bounded thread pool off the event loop)
+    PASSWORD_HASH_CONCURRENCY: int = 4
+    PASSWORD_HASH_QUEUE_SIZE: int = 16  # Waiting hashes beyond this are rejected with 503
+    PASSWORD_HASH_RETRY_AFTER: int = 1  # Seconds, sent in Retry-After when saturated
 
     # Google OAuth
     GOOGLE_CLIENT_ID: Optional[str] = None
@@ -1,8 +1,23 @@
-from typing import AsyncGenerator
+import math
+from typing import AsyncGenerator, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from redis.asyncio import Redis
-from src.infrastructure.database.session import get_session
-from src.infrastructure.cache.redis_client import get_redis
+from src.core.config import settings
+from src.domain.repositories.user_repository import UserRepository
+from src.infrastructure.database.session import get_session, get_read_session
+from src.infrastructure.cache.local_cache import get_user_local_cache
+from src.infrastructure.cache.redis_client import (
+    get_binary_redis_client,
+    get_redis,
+    get_redis_client,
+)
+from src.infrastructure.repositories.batching_user_repository import BatchingUserRepository
+from src.infrastructure.repositories.cached_user_repository import CachedUserRepository
+from src.infrastructure.repositories.single_flight_user_repository import (
+    SingleFlightUserRepository,
+)
+from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+from src.infrastructure.services.token_revocation_service import TokenRevocationService
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -13,9 +28,87 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for getting a read-only database session (routed to a replica)
+    """
+    async for session in get_read_session():
+        yield session
+
+
 async def get_cache() -> AsyncGenerator[Redis, None]:
     """
     Dependency for getting Redis cache client
     """
     async for redis in get_redis():
         yield redis
+
+
+def create_user_repository(
+    db: AsyncSession, read_session: Optional[AsyncSession] = None
+) -> UserRepository:
+    """
+    Build the user repository for a request
+
+    Concurrent ``get_by_id`` calls are batched into IN queries when
+    ``USER_BATCHING_ENABLED`` is set, concurrent identical lookups are
+    coalesced when ``USER_SINGLE_FLIGHT_ENABLED`` is set, and the result is
+    wrapped in the Redis read-through cache, fronted by the worker's
+    in-process cache, when ``USER_CACHE_ENABLED`` is set.
+
+    Args:
+        db: Primary session used for writes
+        read_session: Optional session for reads (may be routed to a replica)
+
+    Returns:
+        User repository
+    """
+    repository: UserRepository = UserRepositoryImpl(db, read_session=read_session)
+    if settings.USER_BATCHING_ENABLED:
+        repository = BatchingUserRepository(repository, session=db)
+    if settings.USER_SINGLE_FLIGHT_ENABLED:
+        repository = SingleFlightUserRepository(repository, session=db)
+    if not settings.USER_CACHE_ENABLED:
+        return repository
+    return CachedUserRepository(
+        repository,
+        get_binary_redis_client(),
+        ttl=settings.REDIS_CACHE_TTL,
+        session=db,
+        local_cache=get_user_local_cache(),
+        invalidation_channel=settings.USER_CACHE_INVALIDATION_CHANNEL,
+        negative_ttl=settings.USER_NEGATIVE_CACHE_TTL,
+        early_refresh_beta=settings.USER_CACHE_EARLY_REFRESH_BETA,
+        # Outlive the worst accepted replica lag so replica reads cannot re-cache old rows
+        tombstone_ttl=(
+            math.ceil(settings.DB_REPLICA_MAX_LAG_SECONDS) + 1
+            if settings.DATABASE_REPLICA_URLS
+            else 0
+        ),
+    )
+
+
+def create_token_revocation_service(
+    session: Optional[AsyncSession] = None,
+) -> TokenRevocationService:
+    """
+    Build the access token revocation store, sized to the access token lifetime
+
+    Args:
+        session: Session whose commit revocations wait for, if any
+
+    Returns:
+        Token revocation service
+    """
+    return TokenRevocationService(
+        get_redis_client(),
+        ttl_seconds=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        session=session,
+    )
+
+
+def create_user_token_revocation(db: AsyncSession) -> Optional[TokenRevocationService]:
+    """Revocation store for user updates, or None when tokens are not trusted statelessly"""
+    if not settings.AUTH_STATELESS_ENABLED:
+        return None
+    return create_token_revocation_service(session=db)
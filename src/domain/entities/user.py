@@ -30,3 +30,33 @@ class User:
     def verify(self) -> None:
         """Verify user account"""
         self.is_verified = True
+
+
+@dataclass
+class UserSummary:
+    """Read model with the public user fields, without credentials or provider ids"""
+
+    id: str
+    email: str
+    username: str
+    full_name: str
+    auth_provider: str
+    is_active: bool
+    is_verified: bool
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserSummary":
+        """Project a full user onto its public fields"""
+        return cls(
+            id=user.id,
+            email=user.email,
+            username=user.username,
+            full_name=user.full_name,
+            auth_provider=user.auth_provider,
+            is_active=user.is_active,
+            is_verified=user.is_verified,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
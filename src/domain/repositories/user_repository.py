@@ -1,6 +1,17 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
-from src.domain.entities.user import User
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Optional, List, Tuple
+from src.domain.entities.user import User, UserSummary
+
+
+@dataclass
+class BulkCreateResult:
+    """Outcome of a bulk insert"""
+
+    created: List[User] = field(default_factory=list)
+    # (position in the input list, reason) for each user that was not inserted
+    conflicts: List[Tuple[int, str]] = field(default_factory=list)
 
 
 class UserRepository(ABC):
@@ -11,19 +22,61 @@ class UserRepository(ABC):
         """Create a new user"""
         pass
 
+    @abstractmethod
+    async def create_many(self, users: List[User], chunk_size: int = 1000) -> BulkCreateResult:
+        """Create many users with batched inserts, reporting rows that conflict"""
+        pass
+
     @abstractmethod
     async def get_by_id(self, user_id: str) -> Optional[User]:
         """Get user by ID"""
         pass
 
+    @abstractmethod
+    async def get_many_by_ids(self, user_ids: List[str]) -> List[User]:
+        """Get the users with the given IDs in one query; unknown IDs are skipped"""
+        pass
+
+    @abstractmethod
+    async def get_summary_by_id(self, user_id: str) -> Optional[UserSummary]:
+        """Get the public fields of a user by ID"""
+        pass
+
     @abstractmethod
     async def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
         pass
 
     @abstractmethod
-    async def get_all(self, skip: int = 0, limit: int = 100) -> List[User]:
-        """Get all users with pagination"""
+    async def get_many_by_emails(self, emails: List[str]) -> List[User]:
+        """Get the users with the given emails in one query; unknown emails are skipped"""
+        pass
+
+    @abstractmethod
+    async def get_by_username(self, username: str) -> Optional[User]:
+        """Get user by username"""
+        pass
+
+    @abstractmethod
+    async def username_exists(self, username: str) -> bool:
+        """Check whether a username is taken"""
+        pass
+
+    @abstractmethod
+    async def next_available_username(self, prefix: str) -> str:
+        """Return ``prefix`` if free, otherwise ``prefix`` followed by the next free number"""
+        pass
+
+    @abstractmethod
+    async def get_page(
+        self, limit: int, after: Optional[Tuple[datetime, str]] = None
+    ) -> List[UserSummary]:
+        """Get up to ``limit`` users ordered by (created_at, id), after the given keyset"""
+        pass
+
+    @abstractmethod
+    def stream_all(self, batch_size: int = 1000) -> AsyncIterator[UserSummary]:
+        """Iterate over all users without loading the whole table into memory"""
         pass
 
     @abstractmethod
@@ -31,6 +84,11 @@ class UserRepository(ABC):
         """Update user"""
         pass
 
+    @abstractmethod
+    async def update_fields(self, user_id: str, changes: Dict[str, Any]) -> Optional[datetime]:
+        """Update only the given fields of a user; returns the new updated_at, None if not found"""
+        pass
+
     @abstractmethod
     async def delete(self, user_id: str) -> bool:
         """Delete user"""
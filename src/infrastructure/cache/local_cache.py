@@ -0,0 +1,145 @@
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Delay before resubscribing after the pub/sub connection drops
+RESUBSCRIBE_DELAY = 1.0
+
+
+class LocalCache:
+    """
+    Size-bounded in-process LRU cache with per-entry TTL
+
+    Not shared between workers; cross-worker consistency relies on
+    invalidation messages (see ``listen_for_invalidations``) with the TTL as
+    an upper bound on staleness if a message is missed.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if absent or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, generation: Optional[int] = None) -> None:
+        """
+        Store a value, evicting the least recently used entry when full
+
+        Args:
+            key: Cache key
+            value: Value to store
+            generation: ``generation`` observed before the value was fetched; the
+                value is dropped if an invalidation happened since then
+        """
+        if generation is not None and generation != self.generation:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, keys: Iterable[str]) -> None:
+        """Drop keys and bump the generation so in-flight fetches are not stored"""
+        self.generation += 1
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+user_local_cache: Optional[LocalCache] = None
+
+
+def get_user_local_cache() -> Optional[LocalCache]:
+    """Get or create this worker's user cache, or None when disabled"""
+    global user_local_cache
+    if user_local_cache is None and settings.USER_LOCAL_CACHE_TTL > 0:
+        user_local_cache = LocalCache(
+            max_size=settings.USER_LOCAL_CACHE_SIZE, ttl=settings.USER_LOCAL_CACHE_TTL
+        )
+    return user_local_cache
+
+
+async def publish_invalidation(redis: Redis, channel: str, keys: Iterable[str]) -> None:
+    """Tell every worker's local cache to drop ``keys``"""
+    await redis.publish(channel, json.dumps(list(keys)))
+
+
+async def listen_for_invalidations(redis: Redis, channel: str, cache: LocalCache) -> None:
+    """
+    Evict local cache entries named in messages on ``channel``, until cancelled
+
+    The whole cache is cleared whenever the subscription is (re)established,
+    since messages published while disconnected are lost. Malformed messages
+    are logged and skipped; any other failure restarts the subscription.
+
+    Args:
+        redis: Redis client used to subscribe
+        channel: Pub/sub channel carrying JSON lists of keys
+        cache: Local cache to evict from
+    """
+    while True:
+        pubsub = redis.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(channel)
+            cache.clear()
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                try:
+                    cache.invalidate(json.loads(message["data"]))
+                except (ValueError, TypeError):
+                    logger.warning("Ignoring malformed cache invalidation message", exc_info=True)
+        except RedisError:
+            cache.clear()
+            logger.warning("Cache invalidation subscription lost, resubscribing", exc_info=True)
+            await asyncio.sleep(RESUBSCRIBE_DELAY)
+        except Exception:
+            cache.clear()
+            logger.exception("Cache invalidation listener failed, restarting")
+            await asyncio.sleep(RESUBSCRIBE_DELAY)
+        finally:
+            await pubsub.close()
@@ -3,6 +3,7 @@ from redis.asyncio import Redis, from_url
 from src.core.config import settings
 
 redis_client: Optional[Redis] = None
+binary_redis_client: Optional[Redis] = None
 
 
 def get_redis_client() -> Redis:
@@ -13,6 +14,14 @@ def get_redis_client() -> Redis:
     return redis_client
 
 
+def get_binary_redis_client() -> Redis:
+    """Get or create a Redis client that returns raw bytes, for binary cache payloads"""
+    global binary_redis_client
+    if binary_redis_client is None:
+        binary_redis_client = from_url(settings.REDIS_URL, decode_responses=False)
+    return binary_redis_client
+
+
 async def get_redis() -> AsyncGenerator[Redis, None]:
     """
     Dependency for getting Redis client
@@ -26,8 +35,11 @@ async def get_redis() -> AsyncGenerator[Redis, None]:
 
 
 async def close_redis():
-    """Close Redis connection"""
-    global redis_client
+    """Close Redis connections"""
+    global redis_client, binary_redis_client
     if redis_client:
         await redis_client.close()
         redis_client = None
+    if binary_redis_client:
+        await binary_redis_client.close()
+        binary_redis_client = None
@@ -0,0 +1,65 @@
+import asyncio
+import copy
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one execution
+
+    The first caller for a key runs the call; callers arriving while it is in
+    flight await the same result and receive a shallow copy of it, so mutating
+    a returned entity cannot leak into another request. If the leading caller
+    is cancelled, waiting callers run the call themselves instead.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.coalesced = 0
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run ``call`` unless an identical call is already in flight
+
+        Args:
+            key: Identifies equivalent calls, e.g. ``("get_by_id", user_id)``
+            call: Zero-argument coroutine function producing the result
+
+        Returns:
+            The result of ``call``, possibly produced for another caller
+        """
+        while key in self._in_flight:
+            future = self._in_flight[key]
+            try:
+                result = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                continue
+            self.coalesced += 1
+            return copy.copy(result)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        self.calls += 1
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Waiters re-raise it; mark it retrieved so an unobserved failure is not logged twice
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._in_flight[key]
+
+    def stats(self) -> Dict[str, Any]:
+        return {"calls": self.calls, "coalesced": self.coalesced, "in_flight": len(self._in_flight)}
@@ -0,0 +1,91 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# Smoothing factor for the moving average of verification cost
+VERIFY_TIME_ALPHA = 0.1
+
+
+class VerifiedTokenCache:
+    """
+    Size-bounded in-process LRU of successfully verified JWT payloads
+
+    Keyed by a BLAKE2b digest of the token so raw bearer tokens are not kept
+    in memory; each entry expires at the token's ``exp``. Only successful
+    verifications are stored, so a flood of forged tokens cannot evict valid
+    ones.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.verify_time = 0.0
+        self.time_saved = 0.0
+        self._entries: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached payload, or None if absent or expired"""
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, payload = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        self.time_saved += self.verify_time
+        return dict(payload)
+
+    def set(self, token: str, payload: Dict[str, Any], elapsed: float) -> None:
+        """
+        Store a verified payload until its ``exp``
+
+        Args:
+            token: Encoded token
+            payload: Verified claims; tokens without ``exp`` are not cached
+            elapsed: Seconds spent verifying it, used to estimate time saved by hits
+        """
+        if self.verify_time:
+            self.verify_time += VERIFY_TIME_ALPHA * (elapsed - self.verify_time)
+        else:
+            self.verify_time = elapsed
+
+        expires_at = payload.get("exp")
+        if not isinstance(expires_at, (int, float)) or self.max_size <= 0:
+            return
+
+        key = self._key(token)
+        self._entries[key] = (float(expires_at), dict(payload))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "verify_time_us": round(self.verify_time * 1_000_000, 1),
+            "time_saved_ms": round(self.time_saved * 1000, 3),
+        }
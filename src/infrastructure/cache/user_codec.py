@@ -0,0 +1,184 @@
+"""
+Compact binary encoding of User entities for the cache
+
+Layout (version 1, big-endian)::
+
+    B  version
+    B  flags (see FLAG_*)
+    16s id as UUID bytes, or a length-prefixed string when FLAG_STRING_ID is set
+    q  created_at, microseconds since the Unix epoch (NO_TIMESTAMP if unset)
+    q  updated_at, same encoding
+    then length-prefixed (H) UTF-8 strings: email, username, full_name,
+    auth_provider, and password_hash / oauth_provider_id when flagged
+
+Decoders reject other versions with ``UnsupportedCodecVersion`` so that,
+during a rolling deploy, old and new workers treat each other's records as
+cache misses instead of misreading them.
+"""
+import struct
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+
+from src.domain.entities.user import User
+
+VERSION = 1
+
+FLAG_ACTIVE = 0x01
+FLAG_VERIFIED = 0x02
+FLAG_PASSWORD = 0x04
+FLAG_OAUTH_ID = 0x08
+FLAG_STRING_ID = 0x10
+
+NO_TIMESTAMP = -(2**63)
+
+_HEADER = struct.Struct("!BB")
+_TIMESTAMPS = struct.Struct("!qq")
+# Fixed prefix of the common case: header, UUID id and timestamps in one unpack
+_UUID_PREFIX = struct.Struct("!BB16sqq")
+_LENGTH = struct.Struct("!H")
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+class UnsupportedCodecVersion(ValueError):
+    """Raised when a payload was written by an incompatible encoder"""
+
+
+def _encode_timestamp(value: Optional[datetime]) -> int:
+    if value is None:
+        return NO_TIMESTAMP
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _decode_timestamp(value: int) -> Optional[datetime]:
+    if value == NO_TIMESTAMP:
+        return None
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _pack_string(parts: List[bytes], value: str) -> None:
+    data = value.encode("utf-8")
+    parts.append(_LENGTH.pack(len(data)))
+    parts.append(data)
+
+
+def _format_uuid(raw: bytes) -> str:
+    # Same output as str(uuid.UUID(bytes=raw)), without building a UUID object
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _unpack_string(data: bytes, offset: int) -> Tuple[str, int]:
+    (length,) = _LENGTH.unpack_from(data, offset)
+    offset += _LENGTH.size
+    end = offset + length
+    if end > len(data):
+        raise ValueError("Truncated user payload")
+    return data[offset:end].decode("utf-8"), end
+
+
+def _uuid_bytes(value: Optional[str]) -> Optional[bytes]:
+    try:
+        return uuid.UUID(value).bytes
+    except (TypeError, ValueError):
+        return None
+
+
+def encode_user(user: User) -> bytes:
+    """
+    Encode a user for the cache
+
+    Args:
+        user: Entity to encode
+
+    Returns:
+        Versioned binary payload
+    """
+    flags = 0
+    if user.is_active:
+        flags |= FLAG_ACTIVE
+    if user.is_verified:
+        flags |= FLAG_VERIFIED
+    if user.password_hash is not None:
+        flags |= FLAG_PASSWORD
+    if user.oauth_provider_id is not None:
+        flags |= FLAG_OAUTH_ID
+
+    # Only ids that round-trip exactly through UUID bytes are stored compactly
+    id_bytes = _uuid_bytes(user.id)
+    if id_bytes is None or _format_uuid(id_bytes) != user.id:
+        id_bytes = None
+        flags |= FLAG_STRING_ID
+
+    parts = [_HEADER.pack(VERSION, flags)]
+    if id_bytes is not None:
+        parts.append(id_bytes)
+    else:
+        _pack_string(parts, user.id or "")
+    parts.append(
+        _TIMESTAMPS.pack(_encode_timestamp(user.created_at), _encode_timestamp(user.updated_at))
+    )
+    for value in (user.email, user.username, user.full_name, user.auth_provider):
+        _pack_string(parts, value)
+    if user.password_hash is not None:
+        _pack_string(parts, user.password_hash)
+    if user.oauth_provider_id is not None:
+        _pack_string(parts, user.oauth_provider_id)
+    return b"".join(parts)
+
+
+def decode_user(data: bytes) -> User:
+    """
+    Decode a payload produced by ``encode_user``
+
+    Args:
+        data: Binary payload
+
+    Returns:
+        User entity
+
+    Raises:
+        UnsupportedCodecVersion: If the payload uses another encoding version
+        ValueError: If a string is cut short or is not valid UTF-8
+        struct.error: If a fixed-size field is cut short
+    """
+    version, flags = _HEADER.unpack_from(data, 0)
+    if version != VERSION:
+        raise UnsupportedCodecVersion(f"Unsupported user codec version {version}")
+
+    if flags & FLAG_STRING_ID:
+        user_id, offset = _unpack_string(data, _HEADER.size)
+        created_at, updated_at = _TIMESTAMPS.unpack_from(data, offset)
+        offset += _TIMESTAMPS.size
+    else:
+        _, _, raw_id, created_at, updated_at = _UUID_PREFIX.unpack_from(data, 0)
+        user_id = _format_uuid(raw_id)
+        offset = _UUID_PREFIX.size
+
+    email, offset = _unpack_string(data, offset)
+    username, offset = _unpack_string(data, offset)
+    full_name, offset = _unpack_string(data, offset)
+    auth_provider, offset = _unpack_string(data, offset)
+    password_hash = oauth_provider_id = None
+    if flags & FLAG_PASSWORD:
+        password_hash, offset = _unpack_string(data, offset)
+    if flags & FLAG_OAUTH_ID:
+        oauth_provider_id, offset = _unpack_string(data, offset)
+
+    return User(
+        id=user_id,
+        email=email,
+        username=username,
+        full_name=full_name,
+        password_hash=password_hash,
+        auth_provider=auth_provider,
+        oauth_provider_id=oauth_provider_id,
+        is_active=bool(flags & FLAG_ACTIVE),
+        is_verified=bool(flags & FLAG_VERIFIED),
+        created_at=_decode_timestamp(created_at),
+        updated_at=_decode_timestamp(updated_at),
+    )
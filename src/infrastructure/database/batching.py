@@ -0,0 +1,108 @@
+import asyncio
+import copy
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, List, Optional, Set, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# Upper bounds of the batch size histogram buckets
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+
+class BatchLoader(Generic[K, V]):
+    """
+    DataLoader-style batcher for point lookups
+
+    Keys requested within ``window`` seconds of each other are collected and
+    resolved with a single ``load_many`` call, dispatched early once
+    ``max_batch_size`` distinct keys are pending. Callers asking for the same
+    key share one slot and each receive a shallow copy of the value.
+    """
+
+    def __init__(
+        self,
+        load_many: Callable[[List[K]], Awaitable[Dict[K, V]]],
+        window: float = 0.002,
+        max_batch_size: int = 100,
+    ):
+        self.load_many = load_many
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.batches = 0
+        self.keys = 0
+        self.max_batch = 0
+        self.histogram: Dict[str, int] = {}
+        self._pending: Dict[K, asyncio.Future] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def load(self, key: K) -> Optional[V]:
+        """
+        Resolve one key as part of the next batch
+
+        Args:
+            key: Key to look up
+
+        Returns:
+            The value, or None if ``load_many`` did not return the key
+        """
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            if len(self._pending) >= self.max_batch_size:
+                self._dispatch()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.window, self._dispatch)
+
+        return copy.copy(await asyncio.shield(future))
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, {}
+        if batch:
+            self._record(len(batch))
+            task = asyncio.get_running_loop().create_task(self._resolve(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, batch: Dict[K, asyncio.Future]) -> None:
+        try:
+            values = await self.load_many(list(batch))
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as exc:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+                    # Waiters re-raise it; mark it retrieved so it is not also logged
+                    future.exception()
+            return
+
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(values.get(key))
+
+    def _record(self, size: int) -> None:
+        self.batches += 1
+        self.keys += size
+        self.max_batch = max(self.max_batch, size)
+        bucket = next((f"<={bound}" for bound in BATCH_SIZE_BUCKETS if size <= bound), None)
+        bucket = bucket or f">{BATCH_SIZE_BUCKETS[-1]}"
+        self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "keys": self.keys,
+            "avg_batch_size": round(self.keys / self.batches, 2) if self.batches else 0.0,
+            "max_batch_size": self.max_batch,
+            "batch_sizes": self.histogram,
+            "pending": len(self._pending),
+        }
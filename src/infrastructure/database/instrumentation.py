@@ -0,0 +1,144 @@
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Maximum characters of SQL text included in slow query log lines
+MAX_LOGGED_STATEMENT = 1000
+
+
+@dataclass
+class QueryStats:
+    """Statements executed within one request (or one measured block)"""
+
+    count: int = 0
+    total_time: float = 0.0
+    statements: List[str] = field(default_factory=list)
+
+
+@dataclass
+class RouteQueryStats:
+    """Aggregate statement statistics for one route"""
+
+    requests: int = 0
+    queries: int = 0
+    total_time: float = 0.0
+    max_queries: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "queries": self.queries,
+            "avg_queries": round(self.queries / self.requests, 2) if self.requests else 0.0,
+            "max_queries": self.max_queries,
+            "total_ms": round(self.total_time * 1000, 3),
+        }
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised when a block issues more statements than its budget allows"""
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+_route_stats: Dict[str, RouteQueryStats] = {}
+
+
+def _redact(parameters: Any) -> str:
+    """Describe bound parameters by type only, so values never reach the logs"""
+    if isinstance(parameters, dict):
+        types = ", ".join(f"{key}: {type(value).__name__}" for key, value in parameters.items())
+        return "{" + types + "}"
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (list, tuple, dict)):
+            return f"<{len(parameters)} parameter sets>"
+        return "(" + ", ".join(type(value).__name__ for value in parameters) + ")"
+    return "<redacted>"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.total_time += elapsed
+        stats.statements.append(statement)
+
+    if elapsed * 1000 >= settings.DB_SLOW_QUERY_MS:
+        logger.warning(
+            "Slow query (%.1f ms): %s params=%s",
+            elapsed * 1000,
+            " ".join(statement.split())[:MAX_LOGGED_STATEMENT],
+            _redact(parameters),
+        )
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """
+    Attach statement counting and slow query logging to an engine
+
+    Statements taking at least ``DB_SLOW_QUERY_MS`` are logged.
+
+    Args:
+        engine: Engine to instrument
+    """
+    sync_engine = engine.sync_engine
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryStats]:
+    """Count statements executed by the current task within the block"""
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextmanager
+def query_budget(max_queries: int) -> Iterator[QueryStats]:
+    """
+    Fail if the block executes more than ``max_queries`` statements
+
+    Intended for tests guarding endpoints against N+1 query patterns.
+
+    Raises:
+        QueryBudgetExceeded: If the budget is exceeded
+    """
+    with count_queries() as stats:
+        yield stats
+
+    if stats.count > max_queries:
+        raise QueryBudgetExceeded(
+            f"Expected at most {max_queries} queries, got {stats.count}:\n"
+            + "\n".join(stats.statements)
+        )
+
+
+def record_route(route: str, stats: QueryStats) -> None:
+    """Fold one request's statement statistics into the per-route aggregate"""
+    aggregate = _route_stats.setdefault(route, RouteQueryStats())
+    aggregate.requests += 1
+    aggregate.queries += stats.count
+    aggregate.total_time += stats.total_time
+    aggregate.max_queries = max(aggregate.max_queries, stats.count)
+
+
+def get_route_stats() -> Dict[str, Dict[str, Any]]:
+    """Per-route statement statistics collected by this worker"""
+    return {route: stats.as_dict() for route, stats in sorted(_route_stats.items())}
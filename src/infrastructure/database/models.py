@@ -1,8 +1,7 @@
-import uuid
 import enum
-from sqlalchemy import Column, String, Boolean, Enum
-from sqlalchemy.dialects.mysql import CHAR
+from sqlalchemy import Column, String, Boolean, Enum, Index
 from src.infrastructure.database.base import Base, TimestampMixin
+from src.infrastructure.database.types import BinaryUUID, uuid7
 
 
 class AuthProvider(enum.Enum):
@@ -13,12 +12,18 @@ class AuthProvider(enum.Enum):
     APPLE = "apple"
 
 
+def generate_user_id() -> str:
+    """Generate a new primary key for a user"""
+    return str(uuid7())
+
+
 class UserModel(Base, TimestampMixin):
     """SQLAlchemy model for User"""
 
     __tablename__ = "users"
+    __table_args__ = (Index("ix_users_created_at_id", "created_at", "id"),)
 
-    id = Column(CHAR(36), primary_key=True, default=lambda: str(uuid.uuid4()), index=True)
+    id = Column(BinaryUUID, primary_key=True, default=generate_user_id)
     email = Column(String(255), unique=True, index=True, nullable=False)
     username = Column(String(100), unique=True, index=True, nullable=False)
     full_name = Column(String(255), nullable=False)
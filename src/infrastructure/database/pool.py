@@ -0,0 +1,74 @@
+import time
+from typing import Any, Dict
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long callers wait for a connection"""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.waiting = 0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def connect(self):
+        """Check out a connection, recording acquire time and waiters"""
+        self.waiting += 1
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            self.waiting -= 1
+
+        elapsed = time.perf_counter() - start
+        self.checkouts += 1
+        self.total_wait_time += elapsed
+        if elapsed > self.max_wait_time:
+            self.max_wait_time = elapsed
+        return connection
+
+
+def get_pool_status(engine: AsyncEngine) -> Dict[str, Any]:
+    """
+    Snapshot of connection pool statistics for an engine
+
+    Args:
+        engine: Async engine to inspect
+
+    Returns:
+        Dictionary with pool sizing and checkout statistics
+    """
+    pool = engine.pool
+    status: Dict[str, Any] = {"pool_class": type(pool).__name__}
+
+    if isinstance(pool, QueuePool):
+        status.update(
+            {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+            }
+        )
+
+    if isinstance(pool, InstrumentedAsyncQueuePool):
+        avg_wait = pool.total_wait_time / pool.checkouts if pool.checkouts else 0.0
+        status.update(
+            {
+                "waiting": pool.waiting,
+                "checkouts": pool.checkouts,
+                "timeouts": pool.timeouts,
+                "avg_wait_ms": round(avg_wait * 1000, 3),
+                "max_wait_ms": round(pool.max_wait_time * 1000, 3),
+            }
+        )
+
+    return status
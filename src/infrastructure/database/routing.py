@@ -0,0 +1,133 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional, Sequence
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import ORMExecuteState, Session
+
+logger = logging.getLogger(__name__)
+
+
+class ReadOnlySessionError(RuntimeError):
+    """Raised when a write is attempted through a read-only session"""
+
+
+class ReadOnlySession(Session):
+    """Session that refuses INSERT/UPDATE/DELETE statements and flushes"""
+
+
+@event.listens_for(ReadOnlySession, "do_orm_execute")
+def _reject_dml(orm_execute_state: ORMExecuteState) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        raise ReadOnlySessionError("Write statement issued on a read-only session")
+
+
+@event.listens_for(ReadOnlySession, "before_flush")
+def _reject_flush(session: Session, flush_context, instances) -> None:
+    if session.new or session.dirty or session.deleted:
+        raise ReadOnlySessionError("Pending changes flushed on a read-only session")
+
+
+class RoutingSessionFactory:
+    """Session factory holding a writer engine and zero or more read replica engines"""
+
+    def __init__(
+        self,
+        writer: AsyncEngine,
+        replicas: Sequence[AsyncEngine] = (),
+        max_lag_seconds: float = 5.0,
+        writer_factory: Optional[async_sessionmaker] = None,
+    ):
+        self.writer = writer
+        self.replicas: List[AsyncEngine] = list(replicas)
+        self.max_lag_seconds = max_lag_seconds
+        self._writer_factory = writer_factory or self._make_factory(writer)
+        # Reads fall back to the primary in AUTOCOMMIT, sharing the writer's pool
+        # rather than opening a second one per worker
+        self._primary_reader_factory = self._make_factory(
+            writer.execution_options(isolation_level="AUTOCOMMIT"), read_only=True
+        )
+        self._replica_factories = [
+            self._make_factory(replica, read_only=True) for replica in self.replicas
+        ]
+        # None means the replica is unreachable or replication is stopped
+        self._replica_lag: Dict[int, Optional[float]] = {i: 0.0 for i in range(len(self.replicas))}
+        self._next_replica = 0
+
+    @staticmethod
+    def _make_factory(engine: AsyncEngine, read_only: bool = False) -> async_sessionmaker:
+        return async_sessionmaker(
+            engine,
+            class_=AsyncSession,
+            sync_session_class=ReadOnlySession if read_only else Session,
+            expire_on_commit=False,
+        )
+
+    @property
+    def writer_factory(self) -> async_sessionmaker:
+        """Session factory bound to the primary"""
+        return self._writer_factory
+
+    def writer_session(self) -> AsyncSession:
+        """Create a session bound to the primary"""
+        return self._writer_factory()
+
+    def reader_session(self) -> AsyncSession:
+        """
+        Create a read-only session for pure reads
+
+        Replicas are used round-robin; lagging or unreachable replicas are
+        skipped, and the primary is used when none is available.
+        """
+        healthy = self.healthy_replicas()
+        if not healthy:
+            return self._primary_reader_factory()
+
+        index = healthy[self._next_replica % len(healthy)]
+        self._next_replica += 1
+        return self._replica_factories[index]()
+
+    def healthy_replicas(self) -> List[int]:
+        """Indexes of replicas whose last measured lag is within the threshold"""
+        return [
+            index
+            for index, lag in self._replica_lag.items()
+            if lag is not None and lag <= self.max_lag_seconds
+        ]
+
+    def replica_lag(self) -> Dict[int, Optional[float]]:
+        """Last measured lag in seconds per replica index"""
+        return dict(self._replica_lag)
+
+    async def check_replica_lag(self) -> None:
+        """Measure replication lag on every replica"""
+        for index, replica in enumerate(self.replicas):
+            try:
+                self._replica_lag[index] = await self._measure_lag(replica)
+            except Exception:
+                logger.warning("Replica %d lag check failed", index, exc_info=True)
+                self._replica_lag[index] = None
+
+    @staticmethod
+    async def _measure_lag(engine: AsyncEngine) -> Optional[float]:
+        async with engine.connect() as conn:
+            result = await conn.exec_driver_sql("SHOW REPLICA STATUS")
+            row = result.mappings().first()
+
+        if row is None:
+            # Not configured as a replica, so it cannot be behind
+            return 0.0
+
+        lag = row.get("Seconds_Behind_Source", row.get("Seconds_Behind_Master"))
+        return float(lag) if lag is not None else None
+
+    async def monitor_replica_lag(self, interval: float) -> None:
+        """Periodically refresh replica lag until cancelled"""
+        while True:
+            await self.check_replica_lag()
+            await asyncio.sleep(interval)
+
+    async def dispose_readers(self) -> None:
+        """Close the replica connection pools"""
+        for replica in self.replicas:
+            await replica.dispose()
@@ -1,30 +1,94 @@
-from typing import AsyncGenerator
+import asyncio
+from typing import Any, AsyncGenerator, Dict
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     create_async_engine,
     async_sessionmaker,
 )
 from sqlalchemy.pool import NullPool
 from src.core.config import settings
+from src.infrastructure.database.instrumentation import instrument_engine
+from src.infrastructure.database.pool import InstrumentedAsyncQueuePool
+from src.infrastructure.database.routing import RoutingSessionFactory
 
 # Create async engine
 engine = None
 async_session_factory = None
+session_router = None
+
+
+def _pool_options() -> Dict[str, Any]:
+    """Engine keyword arguments for the configured pooling mode"""
+    if not settings.DB_POOL_ENABLED:
+        return {"poolclass": NullPool}
+
+    return {
+        "poolclass": InstrumentedAsyncQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def create_engine_for_url(url: str, read_only: bool = False) -> AsyncEngine:
+    """
+    Create an async engine for the given URL using the configured pool settings
+
+    Read-only engines run in AUTOCOMMIT, so each SELECT reads its own committed
+    snapshot and sessions never pay for BEGIN/COMMIT round trips.
+    """
+    options = _pool_options()
+    if read_only:
+        options["isolation_level"] = "AUTOCOMMIT"
+
+    new_engine = create_async_engine(
+        url,
+        echo=settings.DB_ECHO,
+        future=True,
+        **options,
+    )
+    if settings.DB_QUERY_STATS_ENABLED:
+        instrument_engine(new_engine)
+    return new_engine
 
 
 def get_async_engine():
     """Get or create async database engine"""
     global engine
     if engine is None:
-        engine = create_async_engine(
-            settings.DATABASE_URL,
-            echo=settings.DB_ECHO,
-            poolclass=NullPool,
-            future=True,
-        )
+        engine = create_engine_for_url(settings.DATABASE_URL)
     return engine
 
 
+async def warm_up_pool(engine: AsyncEngine, size: int) -> None:
+    """
+    Open connections up front so the first requests skip the connect handshake
+
+    Args:
+        engine: Engine whose pool should be filled
+        size: Number of connections to open (capped at the pool size)
+    """
+    if not settings.DB_POOL_ENABLED or size <= 0:
+        return
+
+    connections = [engine.connect() for _ in range(min(size, settings.DB_POOL_SIZE))]
+    results = await asyncio.gather(
+        *(connection.start() for connection in connections), return_exceptions=True
+    )
+
+    # Closing the connections checks them back into the pool
+    await asyncio.gather(
+        *(connection.close() for connection in connections if connection.sync_connection)
+    )
+
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
 def get_async_session_factory(engine=None):
     """Get or create async session factory"""
     global async_session_factory
@@ -39,6 +103,19 @@ def get_async_session_factory(engine=None):
     return async_session_factory
 
 
+def get_session_router() -> RoutingSessionFactory:
+    """Get or create the session factory routing reads to replicas"""
+    global session_router
+    if session_router is None:
+        session_router = RoutingSessionFactory(
+            get_async_engine(),
+            [create_engine_for_url(url, read_only=True) for url in settings.DATABASE_REPLICA_URLS],
+            max_lag_seconds=settings.DB_REPLICA_MAX_LAG_SECONDS,
+            writer_factory=get_async_session_factory(),
+        )
+    return session_router
+
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for getting async database session
@@ -53,3 +130,14 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
+
+
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for getting a read-only session, bound to a replica when available
+
+    The session runs in autocommit mode and is never committed; any attempt to
+    write through it raises ReadOnlySessionError.
+    """
+    async with get_session_router().reader_session() as session:
+        yield session
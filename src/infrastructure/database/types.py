@@ -0,0 +1,40 @@
+import os
+import time
+import uuid
+from typing import Optional
+from sqlalchemy.types import BINARY, TypeDecorator
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (version 7 layout)
+
+    The first 48 bits are the Unix timestamp in milliseconds, so new keys sort
+    after existing ones and inserts land on the right-most index page.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = bytearray(timestamp_ms.to_bytes(6, "big") + os.urandom(10))
+    value[6] = (value[6] & 0x0F) | 0x70  # version 7
+    value[8] = (value[8] & 0x3F) | 0x80  # RFC 4122 variant
+    return uuid.UUID(bytes=bytes(value))
+
+
+class BinaryUUID(TypeDecorator):
+    """UUID stored as BINARY(16) and presented as a canonical string"""
+
+    impl = BINARY(16)
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        try:
+            return uuid.UUID(str(value)).bytes
+        except ValueError:
+            # Malformed ids cannot exist in the table, so let them match nothing
+            return None
+
+    def process_result_value(self, value: Optional[bytes], dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return str(uuid.UUID(bytes=bytes(value)))
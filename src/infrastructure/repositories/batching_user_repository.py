@@ -0,0 +1,79 @@
+import uuid
+from typing import Dict, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.domain.entities.user import User, UserSummary
+from src.domain.repositories.user_repository import UserRepository
+from src.infrastructure.database.batching import BatchLoader
+from src.infrastructure.database.session import get_session_router
+from src.infrastructure.repositories.delegating_user_repository import DelegatingUserRepository
+from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+
+
+async def load_users_by_id(user_ids: List[str]) -> Dict[str, User]:
+    """Resolve a batch of ids with one IN query on a short-lived read session"""
+    async with get_session_router().reader_session() as session:
+        users = await UserRepositoryImpl(session).get_many_by_ids(user_ids)
+    return {user.id: user for user in users}
+
+
+user_id_loader: Optional[BatchLoader[str, User]] = None
+
+
+def get_user_id_loader() -> BatchLoader[str, User]:
+    """Get or create this worker's get_by_id batcher"""
+    global user_id_loader
+    if user_id_loader is None:
+        user_id_loader = BatchLoader(
+            load_users_by_id,
+            window=settings.USER_BATCH_WINDOW_MS / 1000,
+            max_batch_size=settings.USER_BATCH_MAX_SIZE,
+        )
+    return user_id_loader
+
+
+class BatchingUserRepository(DelegatingUserRepository):
+    """
+    Resolves concurrent ``get_by_id`` lookups across requests with IN queries
+
+    ``get_summary_by_id`` shares the same batches, projecting the full user.
+    Once the request's session has written, lookups go straight to ``inner``
+    so the request keeps reading its own (possibly uncommitted) rows.
+    """
+
+    def __init__(
+        self,
+        inner: UserRepository,
+        session: Optional[AsyncSession] = None,
+        loader: Optional[BatchLoader[str, User]] = None,
+    ):
+        super().__init__(inner)
+        self.session = session
+        self.loader = loader or get_user_id_loader()
+
+    def _bypass(self) -> bool:
+        return self.session is not None and bool(
+            self.session.info.get(UserRepositoryImpl.WRITE_MARKER)
+        )
+
+    async def _load(self, user_id: str) -> Optional[User]:
+        try:
+            # Batch results are keyed by canonical id, so normalize before lookup
+            canonical = str(uuid.UUID(str(user_id)))
+        except ValueError:
+            return None
+        return await self.loader.load(canonical)
+
+    async def get_by_id(self, user_id: str) -> Optional[User]:
+        """Get user by ID"""
+        if self._bypass():
+            return await self.inner.get_by_id(user_id)
+        return await self._load(user_id)
+
+    async def get_summary_by_id(self, user_id: str) -> Optional[UserSummary]:
+        """Get the public fields of a user by ID"""
+        if self._bypass():
+            return await self.inner.get_summary_by_id(user_id)
+        user = await self._load(user_id)
+        return UserSummary.from_user(user) if user else None
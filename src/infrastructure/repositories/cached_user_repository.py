@@ -0,0 +1,474 @@
+import asyncio
+import logging
+import math
+import random
+import struct
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.user import User, UserSummary
+from src.domain.repositories.user_repository import BulkCreateResult, UserRepository
+from src.infrastructure.cache.local_cache import LocalCache, publish_invalidation
+from src.infrastructure.cache.user_codec import UnsupportedCodecVersion, decode_user, encode_user
+from src.infrastructure.repositories.delegating_user_repository import DelegatingUserRepository
+from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "user"
+
+# Cached in place of a record or id when the lookup found no user
+NEGATIVE = b"!"
+
+# Left in place of an invalidated key so fills from lagging replicas cannot overwrite it
+TOMBSTONE = b"~"
+
+# Set each key unless it holds a tombstone; ARGV is the tombstone, the TTL, then one
+# value per key. Returns 1 for each key that was stored and 0 for each that was not.
+FILL_SCRIPT = """
+local stored = {}
+for i, key in ipairs(KEYS) do
+    if redis.call('GET', key) == ARGV[1] then
+        stored[i] = 0
+    else
+        redis.call('SET', key, ARGV[i + 2], 'EX', ARGV[2])
+        stored[i] = 1
+    end
+end
+return stored
+"""
+
+
+class CacheStats:
+    """Hit/miss counters for a cache, per worker"""
+
+    def __init__(self):
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.early_refreshes = 0
+        # Moving average of how long a database lookup takes on a miss
+        self.fetch_time = 0.0
+
+    def record_fetch(self, elapsed: float) -> None:
+        self.fetch_time = elapsed if not self.fetch_time else 0.9 * self.fetch_time + 0.1 * elapsed
+
+    def as_dict(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "early_refreshes": self.early_refreshes,
+            "avg_fetch_ms": round(self.fetch_time * 1000, 3),
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+user_cache_stats = CacheStats()
+
+
+def _id_key(user_id: str) -> str:
+    return f"{KEY_PREFIX}:id:{user_id}"
+
+
+def _email_key(email: str) -> str:
+    return f"{KEY_PREFIX}:email:{email.lower()}"
+
+
+class CachedUserRepository(DelegatingUserRepository):
+    """
+    Read-through Redis cache in front of another UserRepository
+
+    Full records are stored under ``user:id:<id>`` in the binary format of
+    ``user_codec``; ``user:email:<email>`` holds only the id, so invalidating
+    a user means deleting a single record key.
+    An optional in-process ``LocalCache`` sits in front of Redis; evictions are
+    broadcast on ``invalidation_channel`` so other workers drop their copies.
+    Lookups that find nothing are cached as ``NEGATIVE`` for ``negative_ttl``
+    seconds; creating a user evicts its id and email keys, clearing them.
+    With ``early_refresh_beta`` set, a record nearing expiry is occasionally
+    treated as a miss (probabilistic early expiration) so one request
+    refreshes it before every worker misses at once.
+    With ``tombstone_ttl`` set, invalidated keys are replaced by a
+    ``TOMBSTONE`` for that many seconds instead of deleted, and fills never
+    overwrite one, so a read served by a lagging replica cannot re-cache the
+    old row. Nothing is cached while the session has uncommitted writes.
+    Redis failures are logged and fall through to the wrapped repository.
+    """
+
+    # Background invalidations still in flight, kept referenced until done
+    _pending_invalidations: Set[asyncio.Task] = set()
+
+    def __init__(
+        self,
+        inner: UserRepository,
+        redis: Redis,
+        ttl: int,
+        session: Optional[AsyncSession] = None,
+        stats: CacheStats = user_cache_stats,
+        local_cache: Optional[LocalCache] = None,
+        invalidation_channel: Optional[str] = None,
+        negative_ttl: int = 0,
+        early_refresh_beta: float = 0.0,
+        tombstone_ttl: int = 0,
+    ):
+        super().__init__(inner)
+        self.redis = redis
+        self.ttl = ttl
+        self.session = session
+        self.stats = stats
+        self.local_cache = local_cache
+        self.invalidation_channel = invalidation_channel
+        self.negative_ttl = negative_ttl
+        self.early_refresh_beta = early_refresh_beta
+        self.tombstone_ttl = tombstone_ttl
+        self._fill_script = redis.register_script(FILL_SCRIPT)
+
+    def _generation(self) -> Optional[int]:
+        return self.local_cache.generation if self.local_cache is not None else None
+
+    def _has_writes(self) -> bool:
+        """Whether reads go to the primary and may see rows that are not committed yet"""
+        return self.session is not None and bool(
+            self.session.info.get(UserRepositoryImpl.WRITE_MARKER)
+        )
+
+    def _refresh_early(self, remaining_ms: int) -> bool:
+        """
+        Decide whether to recompute a record before it expires
+
+        The chance grows as expiry approaches, scaled by how long a recompute
+        takes, so refreshes of a hot key are spread out instead of synchronized.
+        """
+        if remaining_ms < 0:
+            return False
+        gap = self.stats.fetch_time * self.early_refresh_beta * -math.log(1.0 - random.random())
+        return remaining_ms / 1000 <= gap
+
+    async def _read(self, key: str, early_refresh: bool = False) -> Optional[bytes]:
+        """Read a raw value from the local cache, falling back to Redis"""
+        if self.local_cache is not None:
+            value = self.local_cache.get(key)
+            if value is not None:
+                return value
+
+        generation = self._generation()
+        early_refresh = early_refresh and self.early_refresh_beta > 0
+        try:
+            if early_refresh:
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    pipe.get(key)
+                    pipe.pttl(key)
+                    value, remaining_ms = await pipe.execute()
+            else:
+                value = await self.redis.get(key)
+        except RedisError:
+            self.stats.errors += 1
+            logger.warning("User cache read failed", exc_info=True)
+            return None
+
+        if value == TOMBSTONE:
+            return None
+        if early_refresh and value not in (None, NEGATIVE) and self._refresh_early(remaining_ms):
+            self.stats.early_refreshes += 1
+            return None
+
+        if value is not None and self.local_cache is not None:
+            self.local_cache.set(key, value, generation=generation)
+        return value
+
+    async def _read_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        """Read raw values for several keys, fetching local cache misses with one MGET"""
+        values: List[Optional[bytes]] = [None] * len(keys)
+        remote = []
+        for index, key in enumerate(keys):
+            value = self.local_cache.get(key) if self.local_cache is not None else None
+            if value is None:
+                remote.append(index)
+            values[index] = value
+        if not remote:
+            return values
+
+        generation = self._generation()
+        try:
+            fetched = await self.redis.mget([keys[index] for index in remote])
+        except RedisError:
+            self.stats.errors += 1
+            logger.warning("User cache read failed", exc_info=True)
+            return values
+
+        for index, value in zip(remote, fetched):
+            if value == TOMBSTONE:
+                continue
+            values[index] = value
+            if value is not None and self.local_cache is not None:
+                self.local_cache.set(keys[index], value, generation=generation)
+        return values
+
+    async def _load(self, key: str, raw: Optional[bytes]) -> Optional[User]:
+        """Decode a cached record; anything unreadable counts as a miss"""
+        if not raw or raw == NEGATIVE:
+            return None
+        try:
+            return decode_user(raw)
+        except UnsupportedCodecVersion:
+            # Written by a worker running another release; treat it as a miss
+            return None
+        except (struct.error, ValueError, IndexError):
+            logger.warning("Dropping corrupt user cache entry %s", key, exc_info=True)
+            await self._drop(key)
+            return None
+
+    async def _drop(self, key: str) -> None:
+        """Remove an unreadable entry so the next lookup refills it"""
+        if self.local_cache is not None:
+            self.local_cache.invalidate([key])
+        try:
+            await self.redis.delete(key)
+        except RedisError:
+            self.stats.errors += 1
+            logger.warning("User cache delete failed", exc_info=True)
+
+    async def _get_cached(self, user_id: str) -> Optional[User]:
+        key = _id_key(user_id)
+        return await self._load(key, await self._read(key, early_refresh=True))
+
+    async def _fetch(self, lookup, argument: str) -> Optional[User]:
+        start = time.perf_counter()
+        user = await lookup(argument)
+        self.stats.record_fetch(time.perf_counter() - start)
+        return user
+
+    async def _store(self, user: User, generation: Optional[int]) -> None:
+        """Cache a user loaded from the database before ``generation`` was observed"""
+        await self._store_many([user], generation)
+
+    async def _store_many(self, users: List[User], generation: Optional[int]) -> None:
+        """Cache users loaded from the database, in one round trip"""
+        if not users or self._has_writes():
+            return
+        entries = []
+        for user in users:
+            entries.append((_id_key(user.id), encode_user(user)))
+            entries.append((_email_key(user.email), user.id.encode()))
+        await self._fill(entries, self.ttl, generation)
+
+    async def _fill(
+        self, entries: List[Tuple[str, bytes]], ttl: int, generation: Optional[int]
+    ) -> None:
+        """Write values to Redis except over tombstones, then locally for those stored"""
+        try:
+            stored = await self._fill_script(
+                keys=[key for key, _ in entries],
+                args=[TOMBSTONE, ttl, *(value for _, value in entries)],
+            )
+        except RedisError:
+            self.stats.errors += 1
+            logger.warning("User cache write failed", exc_info=True)
+            return
+        if self.local_cache is not None:
+            for (key, value), was_stored in zip(entries, stored):
+                if was_stored:
+                    self.local_cache.set(key, value, generation=generation)
+
+    async def _store_negative(self, key: str, generation: Optional[int]) -> None:
+        """Remember that a lookup found no user"""
+        if not self.negative_ttl or self._has_writes():
+            return
+        # Guarded like any fill: a replica that has not seen a new user yet
+        # must not hide it for negative_ttl seconds
+        await self._fill([(key, NEGATIVE)], self.negative_ttl, generation)
+
+    def _negative_hit(self) -> None:
+        self.stats.hits += 1
+        self.stats.negative_hits += 1
+
+    async def _invalidate(self, keys: Iterable[str]) -> None:
+        """
+        Delete cache keys now and again once the surrounding transaction commits
+
+        The second delete closes the window in which a concurrent reader could
+        re-cache the pre-commit row.
+        """
+        keys = list(keys)
+        if not keys:
+            return
+        await self._delete_keys(keys)
+
+        if self.session is not None:
+
+            def delete_after_commit(session) -> None:
+                task = asyncio.get_running_loop().create_task(self._delete_keys(keys))
+                self._pending_invalidations.add(task)
+                task.add_done_callback(self._pending_invalidations.discard)
+
+            event.listen(self.session.sync_session, "after_commit", delete_after_commit, once=True)
+
+    async def _delete_keys(self, keys: List[str]) -> None:
+        """Evict keys from Redis and from the local cache of every worker"""
+        if self.local_cache is not None:
+            self.local_cache.invalidate(keys)
+        try:
+            if self.tombstone_ttl:
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    for key in keys:
+                        pipe.set(key, TOMBSTONE, ex=self.tombstone_ttl)
+                    await pipe.execute()
+            else:
+                await self.redis.delete(*keys)
+            if self.local_cache is not None and self.invalidation_channel:
+                await publish_invalidation(self.redis, self.invalidation_channel, keys)
+        except RedisError:
+            self.stats.errors += 1
+            logger.warning("User cache invalidation failed", exc_info=True)
+
+    async def create(self, user: User) -> User:
+        """Create a new user"""
+        created = await self.inner.create(user)
+        await self._invalidate([_id_key(created.id), _email_key(created.email)])
+        return created
+
+    async def create_many(self, users: List[User], chunk_size: int = 1000) -> BulkCreateResult:
+        """Create many users with batched inserts, reporting rows that conflict"""
+        result = await self.inner.create_many(users, chunk_size=chunk_size)
+        await self._invalidate(
+            key for user in result.created for key in (_id_key(user.id), _email_key(user.email))
+        )
+        return result
+
+    async def get_by_id(self, user_id: str) -> Optional[User]:
+        """Get user by ID"""
+        key = _id_key(user_id)
+        raw = await self._read(key, early_refresh=True)
+        if raw == NEGATIVE:
+            self._negative_hit()
+            return None
+        cached = await self._load(key, raw)
+        if cached:
+            self.stats.hits += 1
+            return cached
+
+        self.stats.misses += 1
+        generation = self._generation()
+        user = await self._fetch(self.inner.get_by_id, user_id)
+        if user:
+            await self._store(user, generation)
+        else:
+            await self._store_negative(_id_key(user_id), generation)
+        return user
+
+    async def get_many_by_ids(self, user_ids: List[str]) -> List[User]:
+        """Get the users with the given IDs in one query; unknown IDs are skipped"""
+        user_ids = list(dict.fromkeys(user_ids))
+        records = await self._read_many([_id_key(user_id) for user_id in user_ids])
+
+        users: List[User] = []
+        missing: List[str] = []
+        for user_id, raw in zip(user_ids, records):
+            if raw == NEGATIVE:
+                self._negative_hit()
+                continue
+            cached = await self._load(_id_key(user_id), raw)
+            if cached:
+                self.stats.hits += 1
+                users.append(cached)
+            else:
+                self.stats.misses += 1
+                missing.append(user_id)
+
+        if missing:
+            generation = self._generation()
+            loaded = await self.inner.get_many_by_ids(missing)
+            await self._store_many(loaded, generation)
+            users.extend(loaded)
+        return users
+
+    async def get_many_by_emails(self, emails: List[str]) -> List[User]:
+        """Get the users with the given emails in one query; unknown emails are skipped"""
+        emails = list({email.lower(): email for email in emails}.values())
+        pointers = await self._read_many([_email_key(email) for email in emails])
+
+        resolved: List[Tuple[str, str]] = []
+        missing: List[str] = []
+        for email, user_id in zip(emails, pointers):
+            if user_id == NEGATIVE:
+                self._negative_hit()
+            elif user_id:
+                resolved.append((email, user_id.decode()))
+            else:
+                missing.append(email)
+
+        users: List[User] = []
+        records = await self._read_many([_id_key(user_id) for _, user_id in resolved])
+        for (email, user_id), raw in zip(resolved, records):
+            user = await self._load(_id_key(user_id), raw)
+            # A stale pointer left behind by an email change must not match
+            if user and user.email.lower() == email.lower():
+                self.stats.hits += 1
+                users.append(user)
+            else:
+                missing.append(email)
+
+        self.stats.misses += len(missing)
+        if missing:
+            generation = self._generation()
+            loaded = await self.inner.get_many_by_emails(missing)
+            await self._store_many(loaded, generation)
+            users.extend(loaded)
+        return users
+
+    async def get_summary_by_id(self, user_id: str) -> Optional[UserSummary]:
+        """Get the public fields of a user by ID"""
+        user = await self.get_by_id(user_id)
+        return UserSummary.from_user(user) if user else None
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Get user by email"""
+        user_id = await self._read(_email_key(email))
+        if user_id == NEGATIVE:
+            self._negative_hit()
+            return None
+        if user_id:
+            cached = await self._get_cached(user_id.decode())
+            # A stale pointer left behind by an email change must not match
+            if cached and cached.email.lower() == email.lower():
+                self.stats.hits += 1
+                return cached
+
+        self.stats.misses += 1
+        generation = self._generation()
+        user = await self._fetch(self.inner.get_by_email, email)
+        if user:
+            await self._store(user, generation)
+        else:
+            await self._store_negative(_email_key(email), generation)
+        return user
+
+    async def update(self, user: User) -> User:
+        """Update user"""
+        updated = await self.inner.update(user)
+        await self._invalidate([_id_key(user.id), _email_key(user.email)])
+        return updated
+
+    async def update_fields(self, user_id: str, changes: Dict[str, Any]) -> Optional[datetime]:
+        """Update only the given fields of a user; returns the new updated_at, None if not found"""
+        updated_at = await self.inner.update_fields(user_id, changes)
+        keys = [_id_key(user_id)]
+        if "email" in changes:
+            keys.append(_email_key(changes["email"]))
+        await self._invalidate(keys)
+        return updated_at
+
+    async def delete(self, user_id: str) -> bool:
+        """Delete user"""
+        deleted = await self.inner.delete(user_id)
+        await self._invalidate([_id_key(user_id)])
+        return deleted
@@ -0,0 +1,79 @@
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from src.domain.entities.user import User, UserSummary
+from src.domain.repositories.user_repository import BulkCreateResult, UserRepository
+
+
+class DelegatingUserRepository(UserRepository):
+    """
+    Base for UserRepository decorators
+
+    Forwards every call to ``inner``; subclasses override only the methods
+    they change.
+    """
+
+    def __init__(self, inner: UserRepository):
+        self.inner = inner
+
+    async def create(self, user: User) -> User:
+        """Create a new user"""
+        return await self.inner.create(user)
+
+    async def create_many(self, users: List[User], chunk_size: int = 1000) -> BulkCreateResult:
+        """Create many users with batched inserts, reporting rows that conflict"""
+        return await self.inner.create_many(users, chunk_size=chunk_size)
+
+    async def get_by_id(self, user_id: str) -> Optional[User]:
+        """Get user by ID"""
+        return await self.inner.get_by_id(user_id)
+
+    async def get_many_by_ids(self, user_ids: List[str]) -> List[User]:
+        """Get the users with the given IDs in one query; unknown IDs are skipped"""
+        return await self.inner.get_many_by_ids(user_ids)
+
+    async def get_summary_by_id(self, user_id: str) -> Optional[UserSummary]:
+        """Get the public fields of a user by ID"""
+        return await self.inner.get_summary_by_id(user_id)
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Get user by email"""
+        return await self.inner.get_by_email(email)
+
+    async def get_many_by_emails(self, emails: List[str]) -> List[User]:
+        """Get the users with the given emails in one query; unknown emails are skipped"""
+        return await self.inner.get_many_by_emails(emails)
+
+    async def get_by_username(self, username: str) -> Optional[User]:
+        """Get user by username"""
+        return await self.inner.get_by_username(username)
+
+    async def username_exists(self, username: str) -> bool:
+        """Check whether a username is taken"""
+        return await self.inner.username_exists(username)
+
+    async def next_available_username(self, prefix: str) -> str:
+        """Return ``prefix`` if free, otherwise ``prefix`` followed by the next free number"""
+        return await self.inner.next_available_username(prefix)
+
+    async def get_page(
+        self, limit: int, after: Optional[Tuple[datetime, str]] = None
+    ) -> List[UserSummary]:
+        """Get up to ``limit`` users ordered by (created_at, id), after the given keyset"""
+        return await self.inner.get_page(limit, after=after)
+
+    def stream_all(self, batch_size: int = 1000) -> AsyncIterator[UserSummary]:
+        """Iterate over all users without loading the whole table into memory"""
+        return self.inner.stream_all(batch_size=batch_size)
+
+    async def update(self, user: User) -> User:
+        """Update user"""
+        return await self.inner.update(user)
+
+    async def update_fields(self, user_id: str, changes: Dict[str, Any]) -> Optional[datetime]:
+        """Update only the given fields of a user; returns the new updated_at, None if not found"""
+        return await self.inner.update_fields(user_id, changes)
+
+    async def delete(self, user_id: str) -> bool:
+        """Delete user"""
+        return await self.inner.delete(user_id)
@@ -0,0 +1,56 @@
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.user import User, UserSummary
+from src.domain.repositories.user_repository import UserRepository
+from src.infrastructure.cache.single_flight import SingleFlight
+from src.infrastructure.repositories.delegating_user_repository import DelegatingUserRepository
+from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+
+# Shared by every request in this worker
+user_lookups = SingleFlight()
+
+
+class SingleFlightUserRepository(DelegatingUserRepository):
+    """
+    Coalesces concurrent identical point lookups across requests
+
+    Concurrent ``get_by_id``/``get_by_email``/... calls with the same argument
+    share one query. Once the request's session has written, lookups bypass
+    coalescing so the request keeps reading its own (possibly uncommitted) rows.
+    """
+
+    def __init__(
+        self,
+        inner: UserRepository,
+        session: Optional[AsyncSession] = None,
+        single_flight: SingleFlight = user_lookups,
+    ):
+        super().__init__(inner)
+        self.session = session
+        self.single_flight = single_flight
+
+    async def _coalesce(self, method: str, argument: str, call):
+        if self.session is not None and self.session.info.get(UserRepositoryImpl.WRITE_MARKER):
+            return await call()
+        return await self.single_flight.do((method, argument), call)
+
+    async def get_by_id(self, user_id: str) -> Optional[User]:
+        """Get user by ID"""
+        return await self._coalesce("get_by_id", user_id, lambda: self.inner.get_by_id(user_id))
+
+    async def get_summary_by_id(self, user_id: str) -> Optional[UserSummary]:
+        """Get the public fields of a user by ID"""
+        return await self._coalesce(
+            "get_summary_by_id", user_id, lambda: self.inner.get_summary_by_id(user_id)
+        )
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Get user by email"""
+        return await self._coalesce("get_by_email", email, lambda: self.inner.get_by_email(email))
+
+    async def get_by_username(self, username: str) -> Optional[User]:
+        """Get user by username"""
+        return await self._coalesce(
+            "get_by_username", username, lambda: self.inner.get_by_username(username)
+        )
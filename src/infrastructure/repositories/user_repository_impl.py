@@ -1,22 +1,103 @@
-from typing import Optional, List
-from sqlalchemy import select
+from dataclasses import replace
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Optional, List, Set, Tuple
+from sqlalchemy import (
+    Integer,
+    and_,
+    bindparam,
+    case,
+    cast,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from injector import inject
 
-from src.domain.entities.user import User
-from src.domain.repositories.user_repository import UserRepository
-from src.infrastructure.database.models import UserModel
+from src.domain.entities.user import User, UserSummary
+from src.domain.repositories.user_repository import BulkCreateResult, UserRepository
+from src.infrastructure.database.models import AuthProvider, UserModel, generate_user_id
+
+
+_users = UserModel.__table__
+
+# Hot-path lookups are built once: executions reuse SQLAlchemy's compiled
+# statement cache and return plain rows, skipping ORM entity loading and the
+# identity map (see scripts/benchmark_user_lookups.py)
+_SELECT_BY_ID = select(_users).where(_users.c.id == bindparam("user_id"))
+_SELECT_BY_IDS = select(_users).where(_users.c.id.in_(bindparam("user_ids", expanding=True)))
+_SELECT_BY_EMAIL = select(_users).where(_users.c.email == bindparam("email"))
+_SELECT_BY_EMAILS = select(_users).where(_users.c.email.in_(bindparam("emails", expanding=True)))
+_SELECT_BY_USERNAME = select(_users).where(_users.c.username == bindparam("username"))
+_USERNAME_EXISTS = select(_users.c.id).where(_users.c.username == bindparam("username")).limit(1)
+
+# Columns backing UserSummary; list and profile reads load only these, leaving
+# password_hash and oauth_provider_id on the server
+_SUMMARY_COLUMNS = (
+    _users.c.id,
+    _users.c.email,
+    _users.c.username,
+    _users.c.full_name,
+    _users.c.auth_provider,
+    _users.c.is_active,
+    _users.c.is_verified,
+    _users.c.created_at,
+    _users.c.updated_at,
+)
+_SELECT_SUMMARY_BY_ID = select(*_SUMMARY_COLUMNS).where(_users.c.id == bindparam("user_id"))
+
+
+def _now() -> datetime:
+    # DATETIME columns keep whole seconds; returning the stored value keeps
+    # entities built from known values equal to what a later read returns
+    return datetime.utcnow().replace(microsecond=0)
 
 
 class UserRepositoryImpl(UserRepository):
     """Implementation of UserRepository using SQLAlchemy"""
 
+    # Columns callers may change through update_fields
+    UPDATABLE_FIELDS = frozenset(
+        {
+            "email",
+            "username",
+            "full_name",
+            "password_hash",
+            "oauth_provider_id",
+            "is_active",
+            "is_verified",
+        }
+    )
+
+    # Key in ``AsyncSession.info`` marking that the primary session has written
+    WRITE_MARKER = "has_writes"
+
     @inject
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, read_session: Optional[AsyncSession] = None):
         self.session = session
+        self.read_session = read_session
+
+    @property
+    def _reader(self) -> AsyncSession:
+        """
+        Session for pure reads
+
+        Reads go to the replica session unless the primary session has already
+        written in this request, so callers always see their own writes.
+        """
+        if self.read_session is None or self.session.info.get(self.WRITE_MARKER):
+            return self.session
+        return self.read_session
 
-    def _to_entity(self, model: UserModel) -> User:
-        """Convert SQLAlchemy model to domain entity"""
+    def _mark_write(self) -> None:
+        self.session.info[self.WRITE_MARKER] = True
+
+    def _to_entity(self, model: Any) -> User:
+        """Convert SQLAlchemy model (or a users table row) to domain entity"""
         return User(
             id=model.id,
             email=model.email,
@@ -31,75 +112,255 @@ class UserRepositoryImpl(UserRepository):
             updated_at=model.updated_at,
         )
 
-    def _to_model(self, entity: User) -> UserModel:
-        """Convert domain entity to SQLAlchemy model"""
-        from src.infrastructure.database.models import AuthProvider
-
-        return UserModel(
-            id=entity.id,
-            email=entity.email,
-            username=entity.username,
-            full_name=entity.full_name,
-            password_hash=entity.password_hash,
-            auth_provider=(
+    def _to_summary(self, row: Any) -> UserSummary:
+        """Convert a row of _SUMMARY_COLUMNS to the read model"""
+        return UserSummary(
+            id=row.id,
+            email=row.email,
+            username=row.username,
+            full_name=row.full_name,
+            auth_provider=row.auth_provider.value if row.auth_provider else "local",
+            is_active=row.is_active,
+            is_verified=row.is_verified,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+
+    def _to_row(self, entity: User, now: datetime) -> Dict[str, Any]:
+        """Convert domain entity to a complete users row for Core inserts"""
+        return {
+            "id": entity.id or generate_user_id(),
+            "email": entity.email,
+            "username": entity.username,
+            "full_name": entity.full_name,
+            "password_hash": entity.password_hash,
+            "auth_provider": (
                 AuthProvider(entity.auth_provider) if entity.auth_provider else AuthProvider.LOCAL
             ),
-            oauth_provider_id=entity.oauth_provider_id,
-            is_active=entity.is_active,
-            is_verified=entity.is_verified,
-        )
+            "oauth_provider_id": entity.oauth_provider_id,
+            "is_active": entity.is_active,
+            "is_verified": entity.is_verified,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+    def _row_to_entity(self, row: Dict[str, Any]) -> User:
+        """Build a domain entity from a row dict that was just inserted"""
+        return User(**{**row, "auth_provider": row["auth_provider"].value})
 
     async def create(self, user: User) -> User:
         """Create a new user"""
-        model = self._to_model(user)
-        self.session.add(model)
-        await self.session.flush()
-        await self.session.refresh(model)
-        return self._to_entity(model)
+        # All defaults are generated client-side, so the entity can be built
+        # from the inserted values without reading the row back
+        row = self._to_row(user, _now())
+        self._mark_write()
+        await self.session.execute(insert(UserModel.__table__).values(row))
+        return self._row_to_entity(row)
+
+    async def _existing_identifiers(self, users: List[User]) -> Tuple[Set[str], Set[str]]:
+        """Lower-cased emails and usernames among ``users`` that are already taken"""
+        result = await self.session.execute(
+            select(UserModel.email, UserModel.username).where(
+                or_(
+                    UserModel.email.in_([user.email for user in users]),
+                    UserModel.username.in_([user.username for user in users]),
+                )
+            )
+        )
+        emails: Set[str] = set()
+        usernames: Set[str] = set()
+        for email, username in result:
+            emails.add(email.lower())
+            usernames.add(username.lower())
+        return emails, usernames
+
+    async def create_many(self, users: List[User], chunk_size: int = 1000) -> BulkCreateResult:
+        """Create many users with batched inserts, reporting rows that conflict"""
+        self._mark_write()
+        outcome = BulkCreateResult()
+        now = _now()
+
+        for start in range(0, len(users), chunk_size):
+            chunk = users[start : start + chunk_size]
+            taken_emails, taken_usernames = await self._existing_identifiers(chunk)
+
+            pending: List[Tuple[int, Dict[str, Any]]] = []
+            for index, user in enumerate(chunk, start):
+                if user.email.lower() in taken_emails:
+                    outcome.conflicts.append(
+                        (index, f"User with email {user.email} already exists")
+                    )
+                elif user.username.lower() in taken_usernames:
+                    outcome.conflicts.append(
+                        (index, f"User with username {user.username} already exists")
+                    )
+                else:
+                    pending.append((index, self._to_row(user, now)))
+
+            if not pending:
+                continue
+
+            try:
+                async with self.session.begin_nested():
+                    await self.session.execute(
+                        insert(UserModel.__table__).values([row for _, row in pending])
+                    )
+            except IntegrityError:
+                # A concurrent writer took some of these values after our check;
+                # retry row by row so only the offending rows are rejected
+                pending = await self._insert_individually(pending, outcome)
+
+            outcome.created.extend(self._row_to_entity(row) for _, row in pending)
+
+        return outcome
+
+    async def _insert_individually(
+        self, pending: List[Tuple[int, Dict[str, Any]]], outcome: BulkCreateResult
+    ) -> List[Tuple[int, Dict[str, Any]]]:
+        """Insert rows one at a time, recording conflicts; returns the inserted rows"""
+        inserted = []
+        for index, row in pending:
+            try:
+                async with self.session.begin_nested():
+                    await self.session.execute(insert(UserModel.__table__).values(row))
+            except IntegrityError:
+                outcome.conflicts.append((index, "User with this email or username already exists"))
+            else:
+                inserted.append((index, row))
+        return inserted
 
     async def get_by_id(self, user_id: str) -> Optional[User]:
         """Get user by ID"""
-        result = await self.session.execute(select(UserModel).where(UserModel.id == user_id))
-        model = result.scalar_one_or_none()
-        return self._to_entity(model) if model else None
+        result = await self._reader.execute(_SELECT_BY_ID, {"user_id": user_id})
+        row = result.first()
+        return self._to_entity(row) if row else None
+
+    async def get_many_by_ids(self, user_ids: List[str]) -> List[User]:
+        """Get the users with the given IDs in one query; unknown IDs are skipped"""
+        if not user_ids:
+            return []
+        result = await self._reader.execute(_SELECT_BY_IDS, {"user_ids": list(user_ids)})
+        return [self._to_entity(row) for row in result]
+
+    async def get_summary_by_id(self, user_id: str) -> Optional[UserSummary]:
+        """Get the public fields of a user by ID"""
+        result = await self._reader.execute(_SELECT_SUMMARY_BY_ID, {"user_id": user_id})
+        row = result.first()
+        return self._to_summary(row) if row else None
 
     async def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
-        result = await self.session.execute(select(UserModel).where(UserModel.email == email))
-        model = result.scalar_one_or_none()
-        return self._to_entity(model) if model else None
+        result = await self._reader.execute(_SELECT_BY_EMAIL, {"email": email})
+        row = result.first()
+        return self._to_entity(row) if row else None
+
+    async def get_many_by_emails(self, emails: List[str]) -> List[User]:
+        """Get the users with the given emails in one query; unknown emails are skipped"""
+        if not emails:
+            return []
+        result = await self._reader.execute(_SELECT_BY_EMAILS, {"emails": list(emails)})
+        return [self._to_entity(row) for row in result]
+
+    async def get_by_username(self, username: str) -> Optional[User]:
+        """Get user by username"""
+        result = await self._reader.execute(_SELECT_BY_USERNAME, {"username": username})
+        row = result.first()
+        return self._to_entity(row) if row else None
+
+    async def username_exists(self, username: str) -> bool:
+        """Check whether a username is taken"""
+        result = await self._reader.execute(_USERNAME_EXISTS, {"username": username})
+        return result.first() is not None
 
-    async def get_all(self, skip: int = 0, limit: int = 100) -> List[User]:
-        """Get all users with pagination"""
-        result = await self.session.execute(select(UserModel).offset(skip).limit(limit))
-        models = result.scalars().all()
-        return [self._to_entity(model) for model in models]
+    async def next_available_username(self, prefix: str) -> str:
+        """Return ``prefix`` if free, otherwise ``prefix`` followed by the next free number"""
+        # One range scan over the unique username index: whether the bare prefix
+        # is taken, and the highest purely numeric suffix already in use
+        suffix = func.substr(UserModel.username, len(prefix) + 1)
+        # A plain bound pattern (not concat()) keeps the LIKE sargable
+        pattern = prefix.replace("/", "//").replace("%", "/%").replace("_", "/_")
+        result = await self.session.execute(
+            select(
+                func.max(case((UserModel.username == prefix, 1), else_=0)),
+                func.max(
+                    case((suffix.regexp_match("^[0-9]+$"), cast(suffix, Integer)), else_=None)
+                ),
+            ).where(UserModel.username.like(f"{pattern}%", escape="/"))
+        )
+        prefix_taken, highest_suffix = result.one()
+
+        if not prefix_taken:
+            return prefix
+        return f"{prefix}{(highest_suffix or 0) + 1}"
+
+    async def get_page(
+        self, limit: int, after: Optional[Tuple[datetime, str]] = None
+    ) -> List[UserSummary]:
+        """Get up to ``limit`` users ordered by (created_at, id), after the given keyset"""
+        query = select(*_SUMMARY_COLUMNS).order_by(_users.c.created_at, _users.c.id).limit(limit)
+        if after is not None:
+            created_at, user_id = after
+            # Expanded row comparison so MySQL can range-scan ix_users_created_at_id
+            query = query.where(
+                or_(
+                    UserModel.created_at > created_at,
+                    and_(UserModel.created_at == created_at, UserModel.id > user_id),
+                )
+            )
+
+        result = await self._reader.execute(query)
+        return [self._to_summary(row) for row in result]
+
+    async def stream_all(self, batch_size: int = 1000) -> AsyncIterator[UserSummary]:
+        """Iterate over all users without loading the whole table into memory"""
+        # Core select of the summary columns: rows skip ORM identity-map
+        # bookkeeping, and stream() runs on a server-side cursor
+        query = (
+            select(*_SUMMARY_COLUMNS)
+            .order_by(_users.c.created_at, _users.c.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self._reader.stream(query)
+        async for row in result:
+            yield self._to_summary(row)
 
     async def update(self, user: User) -> User:
         """Update user"""
-        result = await self.session.execute(select(UserModel).where(UserModel.id == user.id))
-        model = result.scalar_one_or_none()
-        if not model:
+        changes = {field: getattr(user, field) for field in self.UPDATABLE_FIELDS}
+        updated_at = await self._update_columns(user.id, changes)
+        if updated_at is None:
             raise ValueError(f"User with id {user.id} not found")
 
-        model.email = user.email
-        model.username = user.username
-        model.full_name = user.full_name
-        model.password_hash = user.password_hash
-        model.is_active = user.is_active
-        model.is_verified = user.is_verified
+        return replace(user, updated_at=updated_at)
+
+    async def update_fields(self, user_id: str, changes: Dict[str, Any]) -> Optional[datetime]:
+        """Update only the given columns of a user; returns the new updated_at, None if not found"""
+        unknown = set(changes) - self.UPDATABLE_FIELDS
+        if unknown:
+            raise ValueError(f"Cannot update fields: {', '.join(sorted(unknown))}")
 
-        await self.session.flush()
-        await self.session.refresh(model)
-        return self._to_entity(model)
+        return await self._update_columns(user_id, changes)
+
+    async def _update_columns(self, user_id: str, changes: Dict[str, Any]) -> Optional[datetime]:
+        """Issue a single UPDATE; returns the new updated_at, or None if no row matched"""
+        self._mark_write()
+        updated_at = _now()
+        # The MySQL dialects enable CLIENT_FOUND_ROWS, so rowcount counts matched
+        # rows even when the new values equal the old ones
+        result = await self.session.execute(
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(**changes, updated_at=updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        return updated_at if result.rowcount else None
 
     async def delete(self, user_id: str) -> bool:
         """Delete user"""
-        result = await self.session.execute(select(UserModel).where(UserModel.id == user_id))
-        model = result.scalar_one_or_none()
-        if not model:
-            return False
-
-        await self.session.delete(model)
-        await self.session.flush()
-        return True
+        self._mark_write()
+        result = await self.session.execute(
+            delete(UserModel)
+            .where(UserModel.id == user_id)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
@@ -0,0 +1,352 @@
+"""
+Specialised JWS encoders/decoders for the tokens JWTService issues
+
+``HS256Codec`` produces exactly the bytes ``jose.jwt.encode`` would for the
+same claims (sorted compact header, compact ``json`` payload, HMAC-SHA256
+signature), and accepts any HS256 token jose accepts with JWTService's decode
+options. It skips jose's per-call work: building the header and the JSON
+encoder, constructing a key object and dispatching on the algorithm.
+
+``AsymmetricCodec`` signs with EdDSA (Ed25519) or ES256 keys tagged with a
+``kid`` so other services can verify tokens against the published JWKS.
+python-jose has no EdDSA support, so both use ``cryptography`` directly.
+"""
+import binascii
+import hashlib
+import hmac
+import json
+from calendar import timegm
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Union
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from cryptography.hazmat.primitives.asymmetric.utils import (
+    decode_dss_signature,
+    encode_dss_signature,
+)
+from jose.exceptions import ExpiredSignatureError, JWTClaimsError, JWTError
+from jose.utils import base64url_decode, base64url_encode
+
+HS256 = "HS256"
+EDDSA = "EdDSA"
+ES256 = "ES256"
+ASYMMETRIC_ALGORITHMS = (EDDSA, ES256)
+
+# Size of each of r and s in a raw (JWS) P-256 signature
+_ES256_COORDINATE_SIZE = 32
+
+PrivateKey = Union[ed25519.Ed25519PrivateKey, ec.EllipticCurvePrivateKey]
+PublicKey = Union[ed25519.Ed25519PublicKey, ec.EllipticCurvePublicKey]
+
+# Registered claims jose converts from datetime to NumericDate when encoding
+_TIME_CLAIMS = ("exp", "iat", "nbf")
+
+
+def _numeric_date(claims: Dict[str, Any], name: str) -> int:
+    try:
+        return int(claims[name])
+    except (TypeError, ValueError):
+        raise JWTClaimsError(f"Claim ({name}) must be an integer.")
+
+
+def _validate_claims(claims: Dict[str, Any]) -> None:
+    # Mirrors jose.jwt.decode's defaults: no audience, issuer or subject expected
+    if "iat" in claims:
+        _numeric_date(claims, "iat")
+
+    if "nbf" in claims or "exp" in claims:
+        now = timegm(datetime.utcnow().utctimetuple())
+        if "nbf" in claims and _numeric_date(claims, "nbf") > now:
+            raise JWTClaimsError("The token is not yet valid (nbf)")
+        if "exp" in claims and _numeric_date(claims, "exp") < now:
+            raise ExpiredSignatureError("Signature has expired.")
+
+    if "aud" in claims:
+        raise JWTClaimsError("Invalid audience")
+    if "sub" in claims and not isinstance(claims["sub"], str):
+        raise JWTClaimsError("Subject must be a string.")
+    if "jti" in claims and not isinstance(claims["jti"], str):
+        raise JWTClaimsError("JWT ID must be a string.")
+
+
+def _convert_time_claims(claims: Dict[str, Any]) -> None:
+    for name in _TIME_CLAIMS:
+        value = claims.get(name)
+        if isinstance(value, datetime):
+            claims[name] = timegm(value.utctimetuple())
+
+
+def _split(token: str):
+    try:
+        signing_input, signature = token.encode("utf-8").rsplit(b".", 1)
+        header, payload = signing_input.split(b".", 1)
+        return signing_input, header, base64url_decode(payload), base64url_decode(signature)
+    except ValueError:
+        raise JWTError("Not enough segments")
+    except (TypeError, binascii.Error):
+        raise JWTError("Invalid padding")
+
+
+def _parse_header(segment: bytes) -> Mapping:
+    try:
+        header = json.loads(base64url_decode(segment).decode("utf-8"))
+    except (TypeError, ValueError, binascii.Error):
+        raise JWTError("Invalid header string")
+    if not isinstance(header, Mapping):
+        raise JWTError("Invalid header string: must be a json object")
+    return header
+
+
+def _parse_claims(payload: bytes) -> Dict[str, Any]:
+    try:
+        claims = json.loads(payload.decode("utf-8"))
+    except ValueError as e:
+        raise JWTError(f"Invalid payload string: {e}")
+    if not isinstance(claims, Mapping):
+        raise JWTError("Invalid payload string: must be a json object")
+    _validate_claims(claims)
+    return claims
+
+
+def _encode_header(header: Dict[str, str]) -> bytes:
+    return base64url_encode(json.dumps(header, separators=(",", ":"), sort_keys=True).encode())
+
+
+class HS256Codec:
+    """
+    Encode and verify HS256 JWTs with a precomputed header and key
+
+    Raises the same ``jose.exceptions`` types as ``jose.jwt`` so callers can
+    switch between the two transparently.
+    """
+
+    def __init__(self, secret_key: str):
+        self._key = secret_key.encode("utf-8")
+        self._encode_json = json.JSONEncoder(separators=(",", ":")).encode
+        self._header = _encode_header({"alg": HS256, "typ": "JWT"})
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        return hmac.digest(self._key, signing_input, hashlib.sha256)
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        """
+        Sign claims into a compact JWT
+
+        Args:
+            claims: Claims to encode; ``exp``/``iat``/``nbf`` may be datetimes
+                (converted in place, as jose does)
+
+        Returns:
+            Encoded token
+        """
+        _convert_time_claims(claims)
+        payload = base64url_encode(self._encode_json(claims).encode("utf-8"))
+        signing_input = self._header + b"." + payload
+        signature = base64url_encode(self._sign(signing_input))
+        return (signing_input + b"." + signature).decode("utf-8")
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        """
+        Verify a compact JWT and return its claims
+
+        Args:
+            token: Encoded token
+
+        Returns:
+            Verified claims
+
+        Raises:
+            JWTError: If the token is malformed, not HS256 or its signature is invalid
+            ExpiredSignatureError: If ``exp`` is in the past
+            JWTClaimsError: If a registered claim is invalid
+        """
+        signing_input, header, payload, signature = _split(token)
+
+        # Tokens we issued share the precomputed header; others are parsed
+        if header != self._header and _parse_header(header).get("alg") != HS256:
+            raise JWTError("The specified alg value is not allowed")
+
+        if not hmac.compare_digest(self._sign(signing_input), signature):
+            raise JWTError("Signature verification failed.")
+
+        return _parse_claims(payload)
+
+
+def load_signing_keys(pems: Dict[str, str]) -> Dict[str, Union[PrivateKey, PublicKey]]:
+    """
+    Load PEM keys by ``kid``
+
+    Args:
+        pems: Key IDs mapped to PEM private keys, or public keys for retired
+            keys that should still verify but no longer sign
+
+    Returns:
+        Key IDs mapped to key objects
+
+    Raises:
+        ValueError: If a PEM cannot be parsed
+    """
+    keys: Dict[str, Union[PrivateKey, PublicKey]] = {}
+    for kid, pem in pems.items():
+        data = pem.encode("utf-8")
+        if b"PRIVATE KEY" in data:
+            keys[kid] = serialization.load_pem_private_key(data, password=None)
+        else:
+            keys[kid] = serialization.load_pem_public_key(data)
+    return keys
+
+
+class AsymmetricCodec:
+    """
+    Encode and verify EdDSA (Ed25519) or ES256 JWTs with ``kid``-tagged keys
+
+    Tokens are signed with the active key; any configured key verifies. This
+    allows rotation without invalidating outstanding tokens: publish the new
+    key, switch the active ``kid`` once verifiers have refreshed their JWKS,
+    and keep the old key (its public half is enough) until every token it
+    signed has expired.
+    """
+
+    def __init__(
+        self,
+        algorithm: str,
+        keys: Dict[str, Union[PrivateKey, PublicKey]],
+        active_kid: Optional[str] = None,
+    ):
+        if algorithm not in ASYMMETRIC_ALGORITHMS:
+            raise ValueError(f"Unsupported signing algorithm {algorithm}")
+        if not keys:
+            raise ValueError(f"{algorithm} signing requires at least one key")
+
+        active_kid = active_kid or next(reversed(keys))
+        signing_key = keys.get(active_kid)
+        if not isinstance(signing_key, (ed25519.Ed25519PrivateKey, ec.EllipticCurvePrivateKey)):
+            raise ValueError(f"Active signing key {active_kid!r} must be a configured private key")
+
+        self.algorithm = algorithm
+        self.active_kid = active_kid
+        self._signing_key = signing_key
+        self._public_keys: Dict[str, PublicKey] = {}
+        for kid, key in keys.items():
+            public_key = key.public_key() if hasattr(key, "public_key") else key
+            self._check_key_type(kid, public_key)
+            self._public_keys[kid] = public_key
+
+        self._encode_json = json.JSONEncoder(separators=(",", ":")).encode
+        # Header segments of every known key, so tokens we issued skip header parsing
+        self._headers = {
+            kid: _encode_header({"alg": algorithm, "kid": kid, "typ": "JWT"})
+            for kid in self._public_keys
+        }
+        self._kids_by_header = {header: kid for kid, header in self._headers.items()}
+        self._jwks = {"keys": [self._jwk(kid, key) for kid, key in self._public_keys.items()]}
+
+    def _check_key_type(self, kid: str, key: PublicKey) -> None:
+        if self.algorithm == EDDSA:
+            valid = isinstance(key, ed25519.Ed25519PublicKey)
+        else:
+            valid = isinstance(key, ec.EllipticCurvePublicKey) and isinstance(
+                key.curve, ec.SECP256R1
+            )
+        if not valid:
+            raise ValueError(f"Key {kid!r} cannot be used with {self.algorithm}")
+
+    def _jwk(self, kid: str, key: PublicKey) -> Dict[str, str]:
+        jwk = {"kid": kid, "use": "sig", "alg": self.algorithm}
+        if self.algorithm == EDDSA:
+            raw = key.public_bytes(serialization.Encoding.Raw, serialization.PublicFormat.Raw)
+            jwk.update(kty="OKP", crv="Ed25519", x=base64url_encode(raw).decode())
+        else:
+            numbers = key.public_numbers()
+            jwk.update(
+                kty="EC",
+                crv="P-256",
+                x=base64url_encode(numbers.x.to_bytes(_ES256_COORDINATE_SIZE, "big")).decode(),
+                y=base64url_encode(numbers.y.to_bytes(_ES256_COORDINATE_SIZE, "big")).decode(),
+            )
+        return jwk
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        if self.algorithm == EDDSA:
+            return self._signing_key.sign(signing_input)
+
+        # JWS uses the raw r || s form rather than DER
+        r, s = decode_dss_signature(
+            self._signing_key.sign(signing_input, ec.ECDSA(hashes.SHA256()))
+        )
+        return r.to_bytes(_ES256_COORDINATE_SIZE, "big") + s.to_bytes(_ES256_COORDINATE_SIZE, "big")
+
+    def _verify(self, key: PublicKey, signing_input: bytes, signature: bytes) -> None:
+        if self.algorithm == EDDSA:
+            key.verify(signature, signing_input)
+            return
+
+        if len(signature) != 2 * _ES256_COORDINATE_SIZE:
+            raise InvalidSignature()
+        r = int.from_bytes(signature[:_ES256_COORDINATE_SIZE], "big")
+        s = int.from_bytes(signature[_ES256_COORDINATE_SIZE:], "big")
+        key.verify(encode_dss_signature(r, s), signing_input, ec.ECDSA(hashes.SHA256()))
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        """
+        Sign claims into a compact JWT with the active key
+
+        Args:
+            claims: Claims to encode; ``exp``/``iat``/``nbf`` may be datetimes
+                (converted in place)
+
+        Returns:
+            Encoded token carrying the active ``kid``
+        """
+        _convert_time_claims(claims)
+        payload = base64url_encode(self._encode_json(claims).encode("utf-8"))
+        signing_input = self._headers[self.active_kid] + b"." + payload
+        signature = base64url_encode(self._sign(signing_input))
+        return (signing_input + b"." + signature).decode("utf-8")
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        """
+        Verify a compact JWT against the key named by its ``kid`` and return its claims
+
+        Args:
+            token: Encoded token
+
+        Returns:
+            Verified claims
+
+        Raises:
+            JWTError: If the token is malformed, uses another algorithm or an
+                unknown key, or its signature is invalid
+            ExpiredSignatureError: If ``exp`` is in the past
+            JWTClaimsError: If a registered claim is invalid
+        """
+        signing_input, header, payload, signature = _split(token)
+
+        kid = self._kids_by_header.get(header)
+        if kid is None:
+            parsed = _parse_header(header)
+            if parsed.get("alg") != self.algorithm:
+                raise JWTError("The specified alg value is not allowed")
+            kid = parsed.get("kid")
+
+        key = self._public_keys.get(kid) if isinstance(kid, str) else None
+        if key is None:
+            raise JWTError("Unknown signing key")
+
+        try:
+            self._verify(key, signing_input, signature)
+        except InvalidSignature:
+            raise JWTError("Signature verification failed.")
+
+        return _parse_claims(payload)
+
+    def jwks(self) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Public keys as a JSON Web Key Set
+
+        Returns:
+            ``{"keys": [...]}`` with one entry per configured key
+        """
+        return self._jwks
@@ -1,17 +1,41 @@
+import time
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Union
 from jose import JWTError, jwt
 from src.core.config import settings
+from src.infrastructure.cache.token_cache import VerifiedTokenCache
+from src.infrastructure.services.jwt_codec import (
+    ASYMMETRIC_ALGORITHMS,
+    HS256,
+    AsymmetricCodec,
+    HS256Codec,
+    load_signing_keys,
+)
 
 
 class JWTService:
     """Service for JWT token generation and validation"""
 
-    def __init__(self):
+    def __init__(self, token_cache: Optional[VerifiedTokenCache] = None):
+        self.token_cache = token_cache
         self.secret_key = settings.JWT_SECRET_KEY
         self.algorithm = settings.JWT_ALGORITHM
         self.access_token_expire_minutes = settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES
         self.refresh_token_expire_days = settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS
+        self.codec: Optional[Union[HS256Codec, AsymmetricCodec]] = None
+        if self.algorithm in ASYMMETRIC_ALGORITHMS:
+            self.codec = AsymmetricCodec(
+                self.algorithm,
+                load_signing_keys(settings.JWT_SIGNING_KEYS),
+                active_kid=settings.JWT_ACTIVE_KEY_ID,
+            )
+        elif settings.JWT_FAST_CODEC_ENABLED and self.algorithm == HS256:
+            self.codec = HS256Codec(self.secret_key)
+
+    def _encode(self, claims: Dict[str, Any]) -> str:
+        if self.codec is not None:
+            return self.codec.encode(claims)
+        return jwt.encode(claims, self.secret_key, algorithm=self.algorithm)
 
     def create_access_token(
         self, data: Dict[str, Any], expires_delta: Optional[timedelta] = None
@@ -33,10 +57,10 @@ class JWTService:
         else:
             expire = datetime.utcnow() + timedelta(minutes=self.access_token_expire_minutes)
 
-        to_encode.update({"exp": expire, "type": "access"})
+        # Sub-second iat so a revocation in the same second as a login is ordered correctly
+        to_encode.update({"exp": expire, "iat": time.time(), "type": "access"})
 
-        encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
-        return encoded_jwt
+        return self._encode(to_encode)
 
     def create_refresh_token(
         self, data: Dict[str, Any], expires_delta: Optional[timedelta] = None
@@ -60,8 +84,7 @@ class JWTService:
 
         to_encode.update({"exp": expire, "type": "refresh"})
 
-        encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
-        return encoded_jwt
+        return self._encode(to_encode)
 
     def decode_token(self, token: str) -> Optional[Dict[str, Any]]:
         """
@@ -73,12 +96,35 @@ class JWTService:
         Returns:
             Decoded token payload or None if invalid
         """
+        if self.token_cache is not None:
+            payload = self.token_cache.get(token)
+            if payload is not None:
+                return payload
+
+        started = time.perf_counter()
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            return payload
+            if self.codec is not None:
+                payload = self.codec.decode(token)
+            else:
+                payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
         except JWTError:
             return None
 
+        if self.token_cache is not None:
+            self.token_cache.set(token, payload, time.perf_counter() - started)
+        return payload
+
+    def jwks(self) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Public verification keys as a JSON Web Key Set
+
+        Returns:
+            ``{"keys": [...]}``; empty for HMAC algorithms, whose secret is never published
+        """
+        if isinstance(self.codec, AsymmetricCodec):
+            return self.codec.jwks()
+        return {"keys": []}
+
     def verify_token(self, token: str, token_type: str = "access") -> Optional[Dict[str, Any]]:
         """
         Verify a JWT token and check its type
@@ -99,3 +145,17 @@ class JWTService:
             return None
 
         return payload
+
+
+jwt_service: Optional[JWTService] = None
+
+
+def get_jwt_service() -> JWTService:
+    """Get or create this worker's JWT service, sharing its verified-token cache"""
+    global jwt_service
+    if jwt_service is None:
+        token_cache = None
+        if settings.JWT_VERIFY_CACHE_SIZE > 0:
+            token_cache = VerifiedTokenCache(max_size=settings.JWT_VERIFY_CACHE_SIZE)
+        jwt_service = JWTService(token_cache=token_cache)
+    return jwt_service
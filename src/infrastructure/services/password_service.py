@@ -1,11 +1,103 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
 from passlib.context import CryptContext
+from src.core.config import settings
+
+T = TypeVar("T")
+
+
+class PasswordHashingBusy(Exception):
+    """Raised when the password hashing pool has no free worker or queue slot"""
+
+
+class PasswordHashPool:
+    """
+    Bounded worker pool for password hashing
+
+    bcrypt releases the GIL while hashing, so threads keep the event loop
+    responsive and hash in parallel without the pickling and start-up cost of
+    worker processes. At most ``max_workers`` hashes run at once and
+    ``max_queue`` more may wait; beyond that calls fail fast with
+    ``PasswordHashingBusy`` instead of queueing without bound.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hash"
+        )
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run ``func(*args)`` on a pool worker
+
+        Raises:
+            PasswordHashingBusy: If every worker and queue slot is taken
+        """
+        if self.pending >= self.max_workers + self.max_queue:
+            self.rejected += 1
+            raise PasswordHashingBusy("Password hashing capacity exhausted")
+
+        loop = asyncio.get_running_loop()
+        self.pending += 1
+        future = self._executor.submit(func, *args)
+        # Counted until the work itself finishes, even if the caller is cancelled
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release))
+        return await asyncio.wrap_future(future)
+
+    def _release(self) -> None:
+        self.pending -= 1
+        self.completed += 1
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "pending": self.pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+
+password_hash_pool: Optional[PasswordHashPool] = None
+
+
+def get_password_hash_pool() -> PasswordHashPool:
+    """Get or create this worker's password hashing pool"""
+    global password_hash_pool
+    if password_hash_pool is None:
+        password_hash_pool = PasswordHashPool(
+            max_workers=settings.PASSWORD_HASH_CONCURRENCY,
+            max_queue=settings.PASSWORD_HASH_QUEUE_SIZE,
+        )
+    return password_hash_pool
+
+
+def shutdown_password_hash_pool() -> None:
+    """Stop the password hashing pool, if one was started"""
+    global password_hash_pool
+    if password_hash_pool is not None:
+        password_hash_pool.shutdown()
+        password_hash_pool = None
 
 
 class PasswordService:
     """Service for password hashing and verification"""
 
-    def __init__(self):
+    def __init__(self, pool: Optional[PasswordHashPool] = None):
         self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self.pool = pool
+
+    def _pool(self) -> PasswordHashPool:
+        return self.pool if self.pool is not None else get_password_hash_pool()
 
     def hash_password(self, password: str) -> str:
         """
@@ -31,3 +123,34 @@ class PasswordService:
             True if password matches, False otherwise
         """
         return self.pwd_context.verify(plain_password, hashed_password)
+
+    async def hash_password_async(self, password: str) -> str:
+        """
+        Hash a plain text password on the hashing pool, without blocking the event loop
+
+        Args:
+            password: Plain text password
+
+        Returns:
+            Hashed password
+
+        Raises:
+            PasswordHashingBusy: If the hashing pool is saturated
+        """
+        return await self._pool().run(self.hash_password, password)
+
+    async def verify_password_async(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verify a password on the hashing pool, without blocking the event loop
+
+        Args:
+            plain_password: Plain text password
+            hashed_password: Hashed password to compare against
+
+        Returns:
+            True if password matches, False otherwise
+
+        Raises:
+            PasswordHashingBusy: If the hashing pool is saturated
+        """
+        return await self._pool().run(self.verify_password, plain_password, hashed_password)
@@ -0,0 +1,77 @@
+import asyncio
+import logging
+import time
+from typing import Optional, Set
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+
+class TokenRevocationService:
+    """
+    Per-user revocation of access tokens that describe an outdated user record
+
+    Revoking stores the time of the change (``auth:revoked:<id>``); access
+    tokens whose ``iat`` is not later than it are rejected, while tokens
+    issued afterwards carry the new profile and are accepted. With a session,
+    the time is recorded once the transaction commits, so tokens issued from
+    the old row while the change was still pending are revoked as well. The
+    key expires after the access token lifetime, since every older token has
+    expired by then.
+    """
+
+    KEY_PREFIX = "auth:revoked"
+
+    # Revocations waiting on a commit, kept referenced until done
+    _pending_revocations: Set[asyncio.Task] = set()
+
+    def __init__(self, redis: Redis, ttl_seconds: int, session: Optional[AsyncSession] = None):
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+        self.session = session
+
+    def _key(self, user_id: str) -> str:
+        return f"{self.KEY_PREFIX}:{user_id}"
+
+    async def revoke_user(self, user_id: str) -> None:
+        """
+        Invalidate every access token issued for a user up to now, or up to the commit
+
+        Args:
+            user_id: User whose tokens are revoked
+        """
+        if self.session is None:
+            await self._revoke(user_id)
+            return
+
+        def revoke_after_commit(session) -> None:
+            task = asyncio.get_running_loop().create_task(self._revoke(user_id))
+            self._pending_revocations.add(task)
+            task.add_done_callback(self._pending_revocations.discard)
+
+        event.listen(self.session.sync_session, "after_commit", revoke_after_commit, once=True)
+
+    async def _revoke(self, user_id: str) -> None:
+        try:
+            await self.redis.set(self._key(user_id), repr(time.time()), ex=self.ttl_seconds)
+        except RedisError:
+            logger.error("Failed to record token revocation for user %s", user_id, exc_info=True)
+
+    async def is_revoked(self, user_id: str, issued_at: float) -> bool:
+        """
+        Check whether a token was issued before its user's tokens were revoked
+
+        Args:
+            user_id: Token subject
+            issued_at: Token ``iat``, in seconds since the epoch
+
+        Returns:
+            True if the token must be rejected
+        """
+        revoked = await self.redis.get(self._key(user_id))
+        if revoked is None:
+            return False
+        return issued_at <= float(revoked)
@@ -1,12 +1,29 @@
-from fastapi import FastAPI
+import asyncio
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 from src.core.config import settings
 from src.infrastructure.database.base import Base
-from src.infrastructure.database.session import get_async_engine
-from src.infrastructure.cache.redis_client import close_redis
+from src.infrastructure.database.instrumentation import get_route_stats
+from src.infrastructure.database.pool import get_pool_status
+from src.infrastructure.database.session import (
+    get_async_engine,
+    get_session_router,
+    warm_up_pool,
+)
+from src.infrastructure.cache.local_cache import get_user_local_cache, listen_for_invalidations
+from src.infrastructure.cache.redis_client import close_redis, get_binary_redis_client
+from src.infrastructure.repositories.batching_user_repository import get_user_id_loader
+from src.infrastructure.repositories.cached_user_repository import user_cache_stats
+from src.infrastructure.repositories.single_flight_user_repository import user_lookups
+from src.infrastructure.services.jwt_service import get_jwt_service
+from src.infrastructure.services.password_service import (
+    get_password_hash_pool,
+    shutdown_password_hash_pool,
+)
 from src.presentation.api.v1 import users, auth
+from src.presentation.middleware import QueryStatsMiddleware
 
 
 @asynccontextmanager
@@ -20,10 +37,41 @@ async def lifespan(app: FastAPI):
         # Create tables if they don't exist
         await conn.run_sync(Base.metadata.create_all)
 
+    # Pre-open pooled connections so early requests skip the connect handshake
+    await warm_up_pool(engine, settings.DB_POOL_WARMUP_SIZE)
+
+    session_router = get_session_router()
+
+    lag_monitor = None
+    if session_router.replicas:
+        # Measure lag once before serving, then keep it fresh in the background
+        await session_router.check_replica_lag()
+        for index in session_router.healthy_replicas():
+            await warm_up_pool(session_router.replicas[index], settings.DB_POOL_WARMUP_SIZE)
+        lag_monitor = asyncio.create_task(
+            session_router.monitor_replica_lag(settings.DB_REPLICA_LAG_CHECK_INTERVAL)
+        )
+
+    invalidation_listener = None
+    local_cache = get_user_local_cache()
+    if settings.USER_CACHE_ENABLED and local_cache is not None:
+        # Evict this worker's cached users when any worker writes
+        invalidation_listener = asyncio.create_task(
+            listen_for_invalidations(
+                get_binary_redis_client(), settings.USER_CACHE_INVALIDATION_CHANNEL, local_cache
+            )
+        )
+
     yield
 
     # Shutdown
+    if lag_monitor:
+        lag_monitor.cancel()
+    if invalidation_listener:
+        invalidation_listener.cancel()
+    shutdown_password_hash_pool()
     await close_redis()
+    await session_router.dispose_readers()
     await engine.dispose()
 
 
@@ -39,6 +87,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Attribute database statements to routes
+if settings.DB_QUERY_STATS_ENABLED:
+    app.add_middleware(
+        QueryStatsMiddleware,
+        query_budget=settings.DB_QUERY_BUDGET,
+        expose_headers=settings.DB_QUERY_STATS_HEADERS,
+    )
+
 # Include routers
 app.include_router(auth.router, prefix=settings.API_V1_PREFIX)
 app.include_router(users.router, prefix=settings.API_V1_PREFIX)
@@ -50,7 +106,62 @@ async def root():
     return {"message": "Welcome to FastAPI Clean Architecture", "version": "1.0.0", "docs": "/docs"}
 
 
+@app.get("/.well-known/jwks.json")
+async def jwks(response: Response):
+    """Public keys other services use to verify access tokens locally"""
+    response.headers["Cache-Control"] = f"public, max-age={settings.JWT_JWKS_MAX_AGE}"
+    return get_jwt_service().jwks()
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
     return {"status": "healthy"}
+
+
+@app.get("/health/db")
+async def database_health():
+    """Database connection pool statistics for this worker"""
+    session_router = get_session_router()
+    lag = session_router.replica_lag()
+    replicas = [
+        {"index": index, "lag_seconds": lag[index], "pool": get_pool_status(replica)}
+        for index, replica in enumerate(session_router.replicas)
+    ]
+    return {
+        "status": "healthy",
+        "pool": get_pool_status(get_async_engine()),
+        "replicas": replicas,
+        "queries": get_route_stats(),
+    }
+
+
+@app.get("/health/batching")
+async def batching_health():
+    """Achieved get_by_id batch sizes for this worker"""
+    return {
+        "status": "healthy",
+        "enabled": settings.USER_BATCHING_ENABLED,
+        "users_by_id": get_user_id_loader().stats(),
+    }
+
+
+@app.get("/health/password-hashing")
+async def password_hashing_health():
+    """Password hashing pool occupancy and rejections for this worker"""
+    return {"status": "healthy", **get_password_hash_pool().stats()}
+
+
+@app.get("/health/cache")
+async def cache_health():
+    """User and verified-token cache hit/miss counters for this worker"""
+    local_cache = get_user_local_cache()
+    token_cache = get_jwt_service().token_cache
+    return {
+        "status": "healthy",
+        "enabled": settings.USER_CACHE_ENABLED,
+        "users": user_cache_stats.as_dict(),
+        "local": local_cache.stats() if local_cache is not None else None,
+        "single_flight": user_lookups.stats(),
+        "tokens": token_cache.stats() if token_cache is not None else None,
+    }
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.dependencies import get_db
+from src.core.config import settings
+from src.core.dependencies import create_user_repository, get_db, get_read_db
 from src.core.auth_dependencies import get_current_user
+from src.presentation.conditional import is_not_modified, not_modified, set_validators, user_etag
 from src.presentation.schemas.auth_schema import (
     UserRegister,
     UserLogin,
@@ -10,25 +12,33 @@ from src.presentation.schemas.auth_schema import (
     RefreshTokenRequest,
     GoogleAuthRequest,
     AppleAuthRequest,
+    UsernameAvailabilityResponse,
 )
 from src.presentation.schemas.user_schema import UserResponse
 from src.application.use_cases.register_user import RegisterUserUseCase
 from src.application.use_cases.login_user import LoginUserUseCase
 from src.application.use_cases.refresh_token import RefreshTokenUseCase
 from src.application.use_cases.oauth_login import OAuthLoginUseCase
-from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
-from src.infrastructure.services.password_service import PasswordService
-from src.infrastructure.services.jwt_service import JWTService
+from src.infrastructure.services.password_service import PasswordHashingBusy, PasswordService
+from src.infrastructure.services.jwt_service import get_jwt_service
 from src.infrastructure.services.google_oauth_service import GoogleOAuthService
 from src.infrastructure.services.apple_oauth_service import AppleOAuthService
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
 
+def _hashing_unavailable() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many concurrent authentication requests, please retry",
+        headers={"Retry-After": str(settings.PASSWORD_HASH_RETRY_AFTER)},
+    )
+
+
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(user_data: UserRegister, db: AsyncSession = Depends(get_db)):
     """Register a new user with email and password"""
-    repository = UserRepositoryImpl(db)
+    repository = create_user_repository(db)
     password_service = PasswordService()
     use_case = RegisterUserUseCase(repository, password_service)
 
@@ -40,21 +50,37 @@ async def register(user_data: UserRegister, db: AsyncSession = Depends(get_db)):
             password=user_data.password,
         )
         return user
+    except PasswordHashingBusy:
+        raise _hashing_unavailable()
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@router.get("/username-available", response_model=UsernameAvailabilityResponse)
+async def username_available(
+    username: str = Query(..., min_length=3, max_length=100),
+    db: AsyncSession = Depends(get_db),
+    read_db: AsyncSession = Depends(get_read_db),
+):
+    """Check whether a username can still be registered"""
+    repository = create_user_repository(db, read_session=read_db)
+    taken = await repository.username_exists(username)
+    return UsernameAvailabilityResponse(username=username, available=not taken)
+
+
 @router.post("/login", response_model=TokenResponse)
 async def login(credentials: UserLogin, db: AsyncSession = Depends(get_db)):
     """Login with email and password"""
-    repository = UserRepositoryImpl(db)
+    repository = create_user_repository(db)
     password_service = PasswordService()
-    jwt_service = JWTService()
+    jwt_service = get_jwt_service()
     use_case = LoginUserUseCase(repository, password_service, jwt_service)
 
     try:
         tokens = await use_case.execute(email=credentials.email, password=credentials.password)
         return tokens
+    except PasswordHashingBusy:
+        raise _hashing_unavailable()
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
 
@@ -62,8 +88,8 @@ async def login(credentials: UserLogin, db: AsyncSession = Depends(get_db)):
 @router.post("/refresh", response_model=TokenResponse)
 async def refresh_token(request: RefreshTokenRequest, db: AsyncSession = Depends(get_db)):
     """Refresh access token using refresh token"""
-    repository = UserRepositoryImpl(db)
-    jwt_service = JWTService()
+    repository = create_user_repository(db)
+    jwt_service = get_jwt_service()
     use_case = RefreshTokenUseCase(repository, jwt_service)
 
     try:
@@ -87,8 +113,8 @@ async def google_auth(request: GoogleAuthRequest, db: AsyncSession = Depends(get
         )
 
     # Login or register user
-    repository = UserRepositoryImpl(db)
-    jwt_service = JWTService()
+    repository = create_user_repository(db)
+    jwt_service = get_jwt_service()
     use_case = OAuthLoginUseCase(repository, jwt_service)
 
     try:
@@ -117,8 +143,8 @@ async def apple_auth(request: AppleAuthRequest, db: AsyncSession = Depends(get_d
         )
 
     # Login or register user
-    repository = UserRepositoryImpl(db)
-    jwt_service = JWTService()
+    repository = create_user_repository(db)
+    jwt_service = get_jwt_service()
     use_case = OAuthLoginUseCase(repository, jwt_service)
 
     try:
@@ -134,6 +160,12 @@ async def apple_auth(request: AppleAuthRequest, db: AsyncSession = Depends(get_d
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user=Depends(get_current_user)):
-    """Get current authenticated user information"""
+async def get_current_user_info(
+    request: Request, response: Response, current_user=Depends(get_current_user)
+):
+    """Get current authenticated user information; supports conditional requests"""
+    etag = user_etag(current_user)
+    if is_not_modified(request, etag, current_user.updated_at):
+        return not_modified(etag, current_user.updated_at)
+    set_validators(response, etag, current_user.updated_at)
     return current_user
@@ -1,20 +1,99 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+import csv
+import io
+import json
+from enum import Enum
+from typing import AsyncIterator, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.dependencies import get_db
-from src.presentation.schemas.user_schema import UserCreate, UserResponse
+from src.core.config import settings
+from src.core.auth_dependencies import get_current_user
+from src.core.dependencies import (
+    create_user_repository,
+    create_user_token_revocation,
+    get_db,
+    get_read_db,
+)
+from src.presentation.conditional import (
+    is_not_modified,
+    not_modified,
+    set_validators,
+    user_etag,
+)
+from src.presentation.schemas.user_schema import (
+    UserBulkConflict,
+    UserBulkCreate,
+    UserBulkCreateResponse,
+    UserCreate,
+    UserListResponse,
+    UserLookupRequest,
+    UserLookupResponse,
+    UserResponse,
+    UserUpdate,
+)
 from src.application.use_cases.create_user import CreateUserUseCase
 from src.application.use_cases.get_user import GetUserUseCase
-from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+from src.application.use_cases.export_users import ExportUsersUseCase
+from src.application.use_cases.bulk_create_users import BulkCreateUsersUseCase
+from src.application.use_cases.update_user import UpdateUserUseCase
+from src.domain.entities.user import UserSummary
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+EXPORT_FIELDS = list(UserResponse.model_fields)
+
+
+class ExportFormat(str, Enum):
+    """Supported bulk export formats"""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+def _export_row(user: UserSummary) -> dict:
+    """Public fields of a user, as exported"""
+    row = {field: getattr(user, field) for field in EXPORT_FIELDS}
+    for field in ("created_at", "updated_at"):
+        if row[field] is not None:
+            row[field] = row[field].isoformat()
+    return row
+
+
+async def _ndjson_chunks(users: AsyncIterator[UserSummary], chunk_size: int) -> AsyncIterator[str]:
+    """Render users as newline-delimited JSON, yielding chunk_size rows at a time"""
+    lines: List[str] = []
+    async for user in users:
+        lines.append(json.dumps(_export_row(user)))
+        if len(lines) >= chunk_size:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+async def _csv_chunks(users: AsyncIterator[UserSummary], chunk_size: int) -> AsyncIterator[str]:
+    """Render users as CSV with a header row, yielding chunk_size rows at a time"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+    writer.writeheader()
+    rows = 0
+    async for user in users:
+        writer.writerow(_export_row(user))
+        rows += 1
+        if rows >= chunk_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            rows = 0
+    if buffer.tell():
+        yield buffer.getvalue()
+
 
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def create_user(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     """Create a new user"""
-    repository = UserRepositoryImpl(db)
+    repository = create_user_repository(db)
     use_case = CreateUserUseCase(repository)
 
     try:
@@ -26,25 +105,146 @@ async def create_user(user_data: UserCreate, db: AsyncSession = Depends(get_db))
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@router.post(
+    "/bulk", response_model=UserBulkCreateResponse, dependencies=[Depends(get_current_user)]
+)
+async def bulk_create_users(batch: UserBulkCreate, db: AsyncSession = Depends(get_db)):
+    """Create a batch of users with multi-row inserts, reporting conflicting rows (authenticated)"""
+    if len(batch.users) > settings.BULK_IMPORT_MAX_ROWS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.BULK_IMPORT_MAX_ROWS} users per request",
+        )
+
+    repository = create_user_repository(db)
+    use_case = BulkCreateUsersUseCase(repository)
+
+    result = await use_case.execute(
+        [user.model_dump() for user in batch.users], chunk_size=settings.BULK_INSERT_CHUNK_SIZE
+    )
+    return UserBulkCreateResponse(
+        created=len(result.created),
+        conflicts=[
+            UserBulkConflict(index=index, email=batch.users[index].email, reason=reason)
+            for index, reason in result.conflicts
+        ],
+    )
+
+
+@router.post("/lookup", response_model=UserLookupResponse)
+async def lookup_users(
+    lookup: UserLookupRequest,
+    db: AsyncSession = Depends(get_db),
+    read_db: AsyncSession = Depends(get_read_db),
+):
+    """Resolve many users by id and/or email in one request"""
+    if len(lookup.ids) + len(lookup.emails) > settings.USER_LOOKUP_MAX_KEYS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.USER_LOOKUP_MAX_KEYS} ids and emails per request",
+        )
+
+    repository = create_user_repository(db, read_session=read_db)
+    use_case = GetUserUseCase(repository)
+
+    result = await use_case.get_many(user_ids=lookup.ids, emails=lookup.emails)
+    return UserLookupResponse(
+        users=result.users, missing_ids=result.missing_ids, missing_emails=result.missing_emails
+    )
+
+
+@router.get("/export", dependencies=[Depends(get_current_user)])
+async def export_users(
+    format: ExportFormat = ExportFormat.NDJSON,
+    db: AsyncSession = Depends(get_db),
+    read_db: AsyncSession = Depends(get_read_db),
+):
+    """Stream every user as NDJSON or CSV in constant memory (authenticated)"""
+    repository = create_user_repository(db, read_session=read_db)
+    use_case = ExportUsersUseCase(repository)
+    users = use_case.execute(batch_size=settings.EXPORT_BATCH_SIZE)
+
+    if format == ExportFormat.CSV:
+        body = _csv_chunks(users, settings.EXPORT_BATCH_SIZE)
+        media_type = "text/csv"
+    else:
+        body = _ndjson_chunks(users, settings.EXPORT_BATCH_SIZE)
+        media_type = "application/x-ndjson"
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="users.{format.value}"'},
+    )
+
+
 @router.get("/{user_id}", response_model=UserResponse)
-async def get_user(user_id: str, db: AsyncSession = Depends(get_db)):
-    """Get user by ID (UUID)"""
-    repository = UserRepositoryImpl(db)
+async def get_user(
+    user_id: str,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    read_db: AsyncSession = Depends(get_read_db),
+):
+    """Get user by ID (UUID); supports conditional requests via ETag/Last-Modified"""
+    repository = create_user_repository(db, read_session=read_db)
     use_case = GetUserUseCase(repository)
 
-    user = await use_case.get_by_id(user_id)
+    user = await use_case.get_summary_by_id(user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=f"User with id {user_id} not found"
         )
+
+    # The summary is usually served from the user cache, so a 304 still skips the database
+    etag = user_etag(user)
+    if is_not_modified(request, etag, user.updated_at):
+        return not_modified(etag, user.updated_at)
+    set_validators(response, etag, user.updated_at)
     return user
 
 
-@router.get("/", response_model=List[UserResponse])
-async def get_users(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)):
-    """Get all users with pagination"""
-    repository = UserRepositoryImpl(db)
+@router.patch("/{user_id}", response_model=UserResponse)
+async def update_user(
+    user_id: str,
+    user_data: UserUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: UserSummary = Depends(get_current_user),
+):
+    """Update only the fields present in the request body; users may only update themselves"""
+    if user_id.lower() != current_user.id.lower():
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed to update this user"
+        )
+
+    repository = create_user_repository(db)
+    use_case = UpdateUserUseCase(repository, token_revocation=create_user_token_revocation(db))
+
+    try:
+        user = await use_case.execute(current_user.id, user_data.model_dump(exclude_unset=True))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"User with id {user_id} not found"
+        )
+    return user
+
+
+@router.get("/", response_model=UserListResponse)
+async def get_users(
+    limit: int = Query(settings.PAGINATION_DEFAULT_LIMIT, ge=1, le=settings.PAGINATION_MAX_LIMIT),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    read_db: AsyncSession = Depends(get_read_db),
+):
+    """Get users with cursor pagination; pass ``next_cursor`` back as ``cursor``"""
+    repository = create_user_repository(db, read_session=read_db)
     use_case = GetUserUseCase(repository)
 
-    users = await use_case.get_all(skip=skip, limit=limit)
-    return users
+    try:
+        page = await use_case.get_page(limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return page
@@ -0,0 +1,75 @@
+import hashlib
+from dataclasses import astuple
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from fastapi import Request, Response, status
+from src.domain.entities.user import UserSummary
+
+# Clients may keep the representation but must revalidate before reusing it
+CACHE_CONTROL = "private, no-cache"
+
+
+def user_etag(user: UserSummary) -> str:
+    """
+    Weak entity tag for a user representation
+
+    Derived from every public field rather than ``updated_at``, which only has
+    one-second resolution, so two edits within the same second still get
+    different tags.
+    """
+    representation = "\x1f".join(str(value) for value in astuple(user))
+    digest = hashlib.blake2b(representation.encode(), digest_size=8)
+    return f'W/"{digest.hexdigest()}"'
+
+
+def _as_utc(value: datetime) -> datetime:
+    # Timestamps are stored as naive UTC
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _opaque(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def is_not_modified(request: Request, etag: str, last_modified: datetime) -> bool:
+    """
+    Evaluate the request's validators against the current representation
+
+    ``If-None-Match`` (weak comparison) takes precedence; ``If-Modified-Since``
+    is only consulted when it is absent.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        return _opaque(etag) in {_opaque(tag) for tag in if_none_match.split(",")}
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            return False
+        # HTTP dates have one-second resolution
+        return _as_utc(last_modified).replace(microsecond=0) <= since
+
+    return False
+
+
+def set_validators(response: Response, etag: str, last_modified: datetime) -> None:
+    """Attach ETag, Last-Modified and Cache-Control headers to a response"""
+    response.headers["ETag"] = etag
+    response.headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def not_modified(etag: str, last_modified: datetime) -> Response:
+    """Empty 304 response carrying the current validators"""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_validators(response, etag, last_modified)
+    return response
@@ -0,0 +1,49 @@
+import logging
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.database.instrumentation import count_queries, record_route
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStatsMiddleware:
+    """
+    ASGI middleware attributing database statements to the route that issued them
+
+    With ``expose_headers`` set, responses also carry ``X-DB-Query-Count`` and
+    ``X-DB-Query-Time-Ms``; these reveal backend behaviour, so they are meant
+    for development and internal deployments only.
+    """
+
+    def __init__(self, app: ASGIApp, query_budget: int = 0, expose_headers: bool = False):
+        self.app = app
+        self.query_budget = query_budget
+        self.expose_headers = expose_headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with count_queries() as stats:
+
+            async def send_with_stats(message: Message) -> None:
+                if self.expose_headers and message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append("X-DB-Query-Count", str(stats.count))
+                    headers.append("X-DB-Query-Time-Ms", f"{stats.total_time * 1000:.1f}")
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_stats)
+            finally:
+                # Label by route template so per-id paths share one entry
+                route = scope.get("route")
+                label = f"{scope['method']} {route.path}" if route else "unmatched"
+                record_route(label, stats)
+
+                if self.query_budget and stats.count > self.query_budget:
+                    logger.warning(
+                        "%s issued %d queries (budget %d)", label, stats.count, self.query_budget
+                    )
@@ -18,6 +18,13 @@ class UserLogin(BaseModel):
     password: str
 
 
+class UsernameAvailabilityResponse(BaseModel):
+    """Schema for username availability check"""
+
+    username: str
+    available: bool
+
+
 class TokenResponse(BaseModel):
     """Schema for token response"""
 
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, EmailStr, ConfigDict
-from typing import Optional
+from pydantic import BaseModel, EmailStr, ConfigDict, Field
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -17,6 +17,19 @@ class UserCreate(UserBase):
     pass
 
 
+class UserBulkCreate(BaseModel):
+    """Schema for creating a batch of users"""
+
+    users: List[UserCreate] = Field(..., min_length=1)
+
+
+class UserLookupRequest(BaseModel):
+    """Schema for resolving a batch of users by id and/or email"""
+
+    ids: List[str] = Field(default_factory=list)
+    emails: List[EmailStr] = Field(default_factory=list)
+
+
 class UserUpdate(BaseModel):
     """Schema for updating a user"""
 
@@ -37,3 +50,33 @@ class UserResponse(UserBase):
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class UserListResponse(BaseModel):
+    """Schema for a page of users"""
+
+    items: List[UserResponse]
+    next_cursor: Optional[str] = None
+
+
+class UserLookupResponse(BaseModel):
+    """Schema for batch lookup result"""
+
+    users: List[UserResponse]
+    missing_ids: List[str]
+    missing_emails: List[str]
+
+
+class UserBulkConflict(BaseModel):
+    """A row of a bulk request that was not inserted"""
+
+    index: int
+    email: str
+    reason: str
+
+
+class UserBulkCreateResponse(BaseModel):
+    """Schema for bulk create result"""
+
+    created: int
+    conflicts: List[UserBulkConflict]
@@ -0,0 +1,15 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from src.infrastructure.database import models  # noqa: F401  (registers the tables)
+from src.infrastructure.database.base import Base
+
+
+@pytest.fixture
+async def db_session():
+    """Session on a fresh in-memory SQLite database with the application schema"""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+    await engine.dispose()
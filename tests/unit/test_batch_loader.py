@@ -0,0 +1,57 @@
+import asyncio
+import pytest
+from src.infrastructure.database.batching import BatchLoader
+
+
+async def test_concurrent_loads_share_one_batch():
+    """Test distinct keys requested together are resolved by one call"""
+    calls = []
+
+    async def load_many(keys):
+        calls.append(sorted(keys))
+        return {key: {"id": key} for key in keys if key != "missing"}
+
+    loader = BatchLoader(load_many, window=0.005, max_batch_size=10)
+
+    results = await asyncio.gather(
+        loader.load("a"), loader.load("b"), loader.load("a"), loader.load("missing")
+    )
+
+    assert calls == [["a", "b", "missing"]]
+    assert results == [{"id": "a"}, {"id": "b"}, {"id": "a"}, None]
+    assert results[0] is not results[2]
+    assert loader.stats()["batch_sizes"] == {"<=4": 1}
+
+
+async def test_full_batch_dispatches_before_window():
+    """Test reaching the batch size limit dispatches without waiting for the window"""
+    calls = []
+
+    async def load_many(keys):
+        calls.append(len(keys))
+        return {key: key for key in keys}
+
+    loader = BatchLoader(load_many, window=10, max_batch_size=2)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(loader.load("a"), loader.load("b"), loader.load("c"), loader.load("d")),
+        timeout=1,
+    )
+
+    assert results == ["a", "b", "c", "d"]
+    assert calls == [2, 2]
+
+
+async def test_load_failure_reaches_every_caller():
+    """Test an error from the batch query is raised to all callers in the batch"""
+
+    async def load_many(keys):
+        raise RuntimeError("database unavailable")
+
+    loader = BatchLoader(load_many, window=0.001)
+
+    results = await asyncio.gather(loader.load("a"), loader.load("b"), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    with pytest.raises(RuntimeError):
+        await loader.load("c")
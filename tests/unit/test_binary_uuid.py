@@ -0,0 +1,37 @@
+import pytest
+import time
+import uuid
+from src.infrastructure.database.types import BinaryUUID, uuid7
+
+
+def test_uuid7_version_and_variant():
+    """Test generated ids carry the version 7 layout"""
+    value = uuid7()
+
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_is_time_ordered():
+    """Test ids generated later sort after earlier ones"""
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+
+    assert first.bytes < second.bytes
+
+
+def test_binary_uuid_round_trip():
+    """Test ids are stored as 16 bytes and read back as canonical strings"""
+    column_type = BinaryUUID()
+    user_id = str(uuid7())
+
+    stored = column_type.process_bind_param(user_id, None)
+
+    assert len(stored) == 16
+    assert column_type.process_result_value(stored, None) == user_id
+
+
+def test_binary_uuid_malformed_id():
+    """Test malformed ids bind to NULL instead of raising"""
+    assert BinaryUUID().process_bind_param("not-a-uuid", None) is None
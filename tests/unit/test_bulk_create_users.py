@@ -0,0 +1,25 @@
+import pytest
+from unittest.mock import AsyncMock
+from src.application.use_cases.bulk_create_users import BulkCreateUsersUseCase
+from src.domain.repositories.user_repository import BulkCreateResult, UserRepository
+
+
+async def test_bulk_create_deduplicates_in_memory():
+    """Test duplicates within a batch are rejected before reaching the repository"""
+    repository = AsyncMock(spec=UserRepository)
+    repository.create_many.return_value = BulkCreateResult(conflicts=[(1, "already exists")])
+    use_case = BulkCreateUsersUseCase(repository)
+
+    result = await use_case.execute(
+        [
+            {"email": "a@example.com", "username": "alice", "full_name": "Alice"},
+            {"email": "A@example.com", "username": "alice2", "full_name": "Alice"},
+            {"email": "b@example.com", "username": "ALICE", "full_name": "Bob"},
+            {"email": "c@example.com", "username": "carol", "full_name": "Carol"},
+        ]
+    )
+
+    sent = repository.create_many.call_args.args[0]
+    assert [user.email for user in sent] == ["a@example.com", "c@example.com"]
+    # Repository conflict index 1 maps back to batch position 3
+    assert [index for index, _ in result.conflicts] == [1, 2, 3]
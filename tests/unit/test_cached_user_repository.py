@@ -0,0 +1,366 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock
+from src.domain.entities.user import User
+from src.domain.repositories.user_repository import UserRepository
+from src.infrastructure.cache import local_cache as local_cache_module
+from src.infrastructure.cache.local_cache import LocalCache, listen_for_invalidations
+from src.infrastructure.cache.user_codec import encode_user
+from src.infrastructure.repositories.cached_user_repository import CacheStats, CachedUserRepository
+from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def set(self, key, value, ex=None):
+        self.commands.append(("set", key, value, ex))
+
+    def get(self, key):
+        self.commands.append(("get", key))
+
+    def pttl(self, key):
+        self.commands.append(("pttl", key))
+
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args) for name, *args in self.commands]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+        self.gets = 0
+        self.published = []
+
+    async def get(self, key):
+        self.gets += 1
+        return self.data.get(key)
+
+    async def mget(self, keys):
+        self.gets += 1
+        return [self.data.get(key) for key in keys]
+
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+        self.ttls[key] = ex * 1000 if ex else -1
+
+    async def pttl(self, key):
+        return self.ttls.get(key, -2)
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def register_script(self, script):
+        # Stands in for FILL_SCRIPT: set each key unless it holds the tombstone
+        async def fill(keys, args):
+            tombstone, ttl, *values = args
+            stored = []
+            for key, value in zip(keys, values):
+                if self.data.get(key) == tombstone:
+                    stored.append(0)
+                else:
+                    await self.set(key, value, ex=ttl)
+                    stored.append(1)
+            return stored
+
+        return fill
+
+
+def make_user(email: str = "test@example.com") -> User:
+    now = datetime(2024, 1, 1, 12, 0, 0)
+    return User(
+        id="user123",
+        email=email,
+        username="testuser",
+        full_name="Test User",
+        created_at=now,
+        updated_at=now,
+    )
+
+
+async def test_lookups_read_through_cache():
+    """Test repeated lookups by id and email are served from Redis"""
+    inner = AsyncMock(spec=UserRepository)
+    inner.get_by_id.return_value = make_user()
+    stats = CacheStats()
+    repository = CachedUserRepository(inner, FakeRedis(), ttl=60, stats=stats)
+
+    first = await repository.get_by_id("user123")
+    second = await repository.get_by_id("user123")
+    by_email = await repository.get_by_email("TEST@example.com")
+
+    assert first == second == by_email == make_user()
+    inner.get_by_id.assert_awaited_once_with("user123")
+    inner.get_by_email.assert_not_awaited()
+    assert (stats.hits, stats.misses) == (2, 1)
+
+
+async def test_update_invalidates_cached_user():
+    """Test an email change evicts the record and the old email no longer matches"""
+    inner = AsyncMock(spec=UserRepository)
+    inner.get_by_id.return_value = make_user()
+    inner.update_fields.return_value = True
+    inner.get_by_email.return_value = None
+    repository = CachedUserRepository(inner, FakeRedis(), ttl=60, stats=CacheStats())
+
+    await repository.get_by_id("user123")
+    await repository.update_fields("user123", {"email": "new@example.com"})
+    inner.get_by_id.return_value = make_user("new@example.com")
+
+    assert (await repository.get_by_id("user123")).email == "new@example.com"
+    assert await repository.get_by_email("test@example.com") is None
+    assert inner.get_by_id.await_count == 2
+
+
+def test_local_cache_evicts_least_recently_used():
+    """Test the local cache is bounded and drops stale fetches after invalidation"""
+    cache = LocalCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    generation = cache.generation
+    cache.invalidate(["a"])
+    cache.set("a", "stale", generation=generation)
+
+    assert cache.get("a") is None
+
+
+async def test_local_cache_fronts_redis():
+    """Test hot lookups skip Redis and writes broadcast an invalidation"""
+    inner = AsyncMock(spec=UserRepository)
+    inner.get_by_id.return_value = make_user()
+    inner.delete.return_value = True
+    redis = FakeRedis()
+    local_cache = LocalCache(max_size=10, ttl=60)
+    repository = CachedUserRepository(
+        inner,
+        redis,
+        ttl=60,
+        stats=CacheStats(),
+        local_cache=local_cache,
+        invalidation_channel="invalidate",
+    )
+
+    await repository.get_by_id("user123")
+    gets = redis.gets
+    await repository.get_by_id("user123")
+    await repository.get_by_email("test@example.com")
+
+    assert redis.gets == gets
+    assert local_cache.hits == 3
+
+    await repository.delete("user123")
+
+    assert local_cache.get("user:id:user123") is None
+    assert redis.published == [("invalidate", '["user:id:user123"]')]
+
+
+async def test_missing_email_is_cached_until_created():
+    """Test lookups for unknown emails stop reaching the database until the user exists"""
+    inner = AsyncMock(spec=UserRepository)
+    inner.get_by_email.return_value = None
+    stats = CacheStats()
+    repository = CachedUserRepository(inner, FakeRedis(), ttl=60, stats=stats, negative_ttl=30)
+
+    assert await repository.get_by_email("test@example.com") is None
+    assert await repository.get_by_email("Test@example.com") is None
+    assert inner.get_by_email.await_count == 1
+    assert stats.negative_hits == 1
+
+    inner.create.return_value = make_user()
+    await repository.create(make_user())
+    inner.get_by_email.return_value = make_user()
+
+    assert await repository.get_by_email("test@example.com") == make_user()
+    assert inner.get_by_email.await_count == 2
+
+
+async def test_record_near_expiry_is_refreshed_early():
+    """Test a record about to expire is reloaded before it actually expires"""
+    inner = AsyncMock(spec=UserRepository)
+    inner.get_by_id.return_value = make_user()
+    redis = FakeRedis()
+    stats = CacheStats()
+    repository = CachedUserRepository(inner, redis, ttl=60, stats=stats, early_refresh_beta=1.0)
+
+    await repository.get_by_id("user123")
+    await repository.get_by_id("user123")
+    assert inner.get_by_id.await_count == 1
+
+    stats.fetch_time = 3600.0
+    redis.ttls["user:id:user123"] = 1
+
+    await repository.get_by_id("user123")
+    assert inner.get_by_id.await_count == 2
+    assert stats.early_refreshes == 1
+
+
+async def test_multi_get_fetches_only_cache_misses():
+    """Test a multi-get reads cached users with one MGET and queries only the rest"""
+    inner = AsyncMock(spec=UserRepository)
+    inner.get_by_id.return_value = make_user()
+    other = User(id="user456", email="other@example.com", username="other", full_name="Other")
+    inner.get_many_by_ids.return_value = [other]
+    redis = FakeRedis()
+    repository = CachedUserRepository(inner, redis, ttl=60, stats=CacheStats())
+    await repository.get_by_id("user123")
+
+    users = await repository.get_many_by_ids(["user123", "user456", "user123"])
+
+    assert [user.id for user in users] == ["user123", "user456"]
+    inner.get_many_by_ids.assert_awaited_once_with(["user456"])
+    assert await repository.get_many_by_emails(["OTHER@example.com"]) == [other]
+    inner.get_many_by_emails.assert_not_awaited()
+
+
+async def test_stale_fill_after_invalidation_is_refused():
+    """Test a lookup that read the old row before an update cannot re-cache it afterwards"""
+    old, new = make_user(), make_user("new@example.com")
+    read_started, update_done = asyncio.Event(), asyncio.Event()
+
+    async def lagging_get_by_id(user_id):
+        # Reads the row, then stalls until the update has invalidated the cache
+        read_started.set()
+        await update_done.wait()
+        return old
+
+    inner = AsyncMock(spec=UserRepository)
+    inner.get_by_id.side_effect = lagging_get_by_id
+    inner.update_fields.return_value = datetime(2024, 1, 2)
+    redis = FakeRedis()
+    local_cache = LocalCache(max_size=10, ttl=60)
+    repository = CachedUserRepository(
+        inner, redis, ttl=60, stats=CacheStats(), local_cache=local_cache, tombstone_ttl=5
+    )
+
+    reader = asyncio.create_task(repository.get_by_id("user123"))
+    await read_started.wait()
+    await repository.update_fields("user123", {"email": "new@example.com"})
+    update_done.set()
+
+    assert await reader == old
+    assert local_cache.get("user:id:user123") is None
+
+    inner.get_by_id.side_effect = None
+    inner.get_by_id.return_value = new
+    assert await repository.get_by_id("user123") == new
+    assert inner.get_by_id.await_count == 2
+
+
+async def test_uncommitted_writes_are_not_cached():
+    """Test lookups on a session with pending writes go uncached"""
+    session = AsyncMock()
+    session.info = {UserRepositoryImpl.WRITE_MARKER: True}
+    inner = AsyncMock(spec=UserRepository)
+    inner.get_by_id.return_value = make_user()
+    redis = FakeRedis()
+    repository = CachedUserRepository(
+        inner, redis, ttl=60, session=session, stats=CacheStats(), negative_ttl=30
+    )
+
+    await repository.get_by_id("user123")
+    inner.get_by_email.return_value = None
+    await repository.get_by_email("missing@example.com")
+
+    assert redis.data == {}
+
+
+class FakePubSub:
+    def __init__(self, messages, failure):
+        self.messages = messages
+        self.failure = failure
+
+    async def subscribe(self, channel):
+        pass
+
+    async def listen(self):
+        for data in self.messages:
+            yield {"type": "message", "data": data}
+        raise self.failure
+
+    async def close(self):
+        pass
+
+
+async def test_invalidation_listener_survives_bad_messages(monkeypatch):
+    """Test malformed messages are skipped and an unexpected failure resubscribes"""
+    monkeypatch.setattr(local_cache_module, "RESUBSCRIBE_DELAY", 0)
+    subscriptions = [
+        FakePubSub([b"not json", b"42", b'["a"]'], RuntimeError("boom")),
+        FakePubSub([b'["b"]'], asyncio.CancelledError()),
+    ]
+    redis = AsyncMock()
+    redis.pubsub = lambda **kwargs: subscriptions.pop(0)
+    cache = LocalCache(max_size=10, ttl=60)
+    invalidated = []
+    invalidate = cache.invalidate
+
+    def record_invalidation(keys):
+        invalidate(keys)
+        invalidated.append(keys)
+
+    cache.invalidate = record_invalidation
+
+    listener = asyncio.create_task(listen_for_invalidations(redis, "invalidate", cache))
+    await asyncio.wait([listener])
+
+    assert listener.cancelled()
+    assert invalidated == [["a"], ["b"]]
+
+
+async def test_lagging_miss_after_create_is_not_cached():
+    """Test a replica that has not seen a new user yet cannot cache it as missing"""
+    inner = AsyncMock(spec=UserRepository)
+    inner.create.return_value = make_user()
+    inner.get_by_email.return_value = None
+    repository = CachedUserRepository(
+        inner, FakeRedis(), ttl=60, stats=CacheStats(), negative_ttl=30, tombstone_ttl=5
+    )
+
+    await repository.create(make_user())
+    assert await repository.get_by_email("test@example.com") is None
+
+    inner.get_by_email.return_value = make_user()
+    assert await repository.get_by_email("test@example.com") == make_user()
+
+
+async def test_corrupt_record_is_dropped_and_reloaded():
+    """Test a truncated record is treated as a miss and removed from Redis"""
+    inner = AsyncMock(spec=UserRepository)
+    inner.get_by_id.return_value = make_user()
+    redis = FakeRedis()
+    repository = CachedUserRepository(inner, redis, ttl=60, stats=CacheStats())
+    await repository.get_by_id("user123")
+
+    for size in (1, 10, len(redis.data["user:id:user123"]) - 1):
+        redis.data["user:id:user123"] = encode_user(make_user())[:size]
+        assert await repository.get_by_id("user123") == make_user()
+
+    assert inner.get_by_id.await_count == 4
+    assert redis.data["user:id:user123"] == encode_user(make_user())
+
+    redis.data["user:id:user123"] = b"\x01"
+    inner.get_by_id.return_value = None
+    assert await repository.get_by_id("user123") is None
+    assert "user:id:user123" not in redis.data
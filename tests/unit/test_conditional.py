@@ -0,0 +1,64 @@
+from dataclasses import replace
+from datetime import datetime
+from starlette.requests import Request
+from src.domain.entities.user import UserSummary
+from src.presentation.conditional import is_not_modified, user_etag
+
+UPDATED_AT = datetime(2024, 1, 1, 12, 0, 0, 500000)
+
+USER = UserSummary(
+    id="user123",
+    email="test@example.com",
+    username="testuser",
+    full_name="Test User",
+    auth_provider="local",
+    is_active=True,
+    is_verified=False,
+    created_at=datetime(2024, 1, 1),
+    updated_at=UPDATED_AT,
+)
+
+
+def make_request(**headers) -> Request:
+    raw = [
+        (name.replace("_", "-").lower().encode(), value.encode()) for name, value in headers.items()
+    ]
+    return Request({"type": "http", "method": "GET", "headers": raw})
+
+
+def test_etag_changes_with_representation():
+    """Test the ETag identifies the user and changes with any field, not just updated_at"""
+    etag = user_etag(USER)
+
+    assert etag.startswith('W/"')
+    assert etag == user_etag(replace(USER))
+    assert etag != user_etag(replace(USER, id="user456"))
+    assert etag != user_etag(replace(USER, updated_at=datetime(2024, 1, 2)))
+    # Two edits within the same second of updated_at
+    assert etag != user_etag(replace(USER, full_name="Renamed"))
+
+
+def test_if_none_match_uses_weak_comparison():
+    """Test matching tags (weak or strong form) yield 304 and If-None-Match wins"""
+    etag = user_etag(USER)
+    opaque = etag[2:]
+
+    assert is_not_modified(make_request(if_none_match=f'"other", {opaque}'), etag, UPDATED_AT)
+    assert not is_not_modified(
+        make_request(if_none_match='"other"', if_modified_since="Mon, 01 Jan 2024 12:00:00 GMT"),
+        etag,
+        UPDATED_AT,
+    )
+
+
+def test_if_modified_since_ignores_subsecond_precision():
+    """Test a Last-Modified date echoed back by the client validates"""
+    etag = user_etag(USER)
+
+    assert is_not_modified(
+        make_request(if_modified_since="Mon, 01 Jan 2024 12:00:00 GMT"), etag, UPDATED_AT
+    )
+    assert not is_not_modified(
+        make_request(if_modified_since="Mon, 01 Jan 2024 11:59:59 GMT"), etag, UPDATED_AT
+    )
+    assert not is_not_modified(make_request(), etag, UPDATED_AT)
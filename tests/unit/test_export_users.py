@@ -0,0 +1,61 @@
+import csv
+import io
+import json
+import httpx
+from src.core.auth_dependencies import get_current_user
+from src.core.config import settings
+from src.core.dependencies import get_db, get_read_db
+from src.domain.entities.user import User, UserSummary
+from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+from src.main import app
+from src.presentation.api.v1.users import EXPORT_FIELDS
+
+
+async def create_users(repository: UserRepositoryImpl, count: int):
+    users = [
+        await repository.create(User(email=f"user{i}@example.com", username=f"user{i}"))
+        for i in range(count)
+    ]
+    return sorted(users, key=lambda user: (user.created_at, user.id))
+
+
+async def test_stream_all_yields_every_user_in_keyset_order(db_session):
+    """Test streaming in small batches returns each user once, ordered by (created_at, id)"""
+    repository = UserRepositoryImpl(db_session)
+    users = await create_users(repository, 5)
+
+    streamed = [user async for user in repository.stream_all(batch_size=2)]
+
+    assert [user.id for user in streamed] == [user.id for user in users]
+
+
+async def test_export_streams_ndjson_and_csv(db_session, monkeypatch):
+    """Test both export formats cover every row across chunk boundaries, and need a login"""
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 2)
+    repository = UserRepositoryImpl(db_session)
+    users = await create_users(repository, 5)
+
+    async def session():
+        yield db_session
+
+    app.dependency_overrides[get_db] = session
+    app.dependency_overrides[get_read_db] = session
+    try:
+        async with httpx.AsyncClient(app=app, base_url="http://test") as http:
+            anonymous = await http.get("/api/v1/users/export")
+            app.dependency_overrides[get_current_user] = lambda: UserSummary.from_user(users[0])
+            ndjson = await http.get("/api/v1/users/export")
+            csv_response = await http.get("/api/v1/users/export", params={"format": "csv"})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert anonymous.status_code == 403
+
+    lines = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert ndjson.headers["content-type"] == "application/x-ndjson"
+    assert [line["id"] for line in lines] == [user.id for user in users]
+
+    reader = csv.DictReader(io.StringIO(csv_response.text))
+    rows = list(reader)
+    assert reader.fieldnames == list(EXPORT_FIELDS)
+    assert [row["id"] for row in rows] == [user.id for user in users]
@@ -1,5 +1,9 @@
 import pytest
-from datetime import timedelta
+from datetime import datetime, timedelta
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from jose import JWTError, jwt
+from src.infrastructure.cache.token_cache import VerifiedTokenCache
+from src.infrastructure.services.jwt_codec import AsymmetricCodec, HS256Codec
 from src.infrastructure.services.jwt_service import JWTService
 
 
@@ -99,3 +103,93 @@ def test_custom_expiration():
 
     assert decoded is not None
     assert "exp" in decoded
+
+
+def test_verified_token_cache():
+    """Test repeated tokens are served from the cache until they expire"""
+    token_cache = VerifiedTokenCache(max_size=10)
+    jwt_service = JWTService(token_cache=token_cache)
+    token = jwt_service.create_access_token({"sub": "user123"})
+
+    first = jwt_service.verify_token(token)
+    first["sub"] = "mutated"
+    second = jwt_service.verify_token(token)
+
+    assert second["sub"] == "user123"
+    assert token_cache.hits == 1
+    assert token_cache.misses == 1
+
+    # Invalid and expired tokens are never served from the cache
+    assert jwt_service.decode_token("invalid.token.here") is None
+    expired = jwt_service.create_access_token({"sub": "user123"}, timedelta(seconds=-1))
+    assert jwt_service.decode_token(expired) is None
+    assert token_cache.stats()["size"] == 1
+
+
+def test_fast_codec_matches_jose():
+    """Test the HS256 fast path produces and accepts the same tokens as python-jose"""
+    codec = HS256Codec("secret")
+    claims = {"sub": "user123", "name": "Zoë", "exp": datetime.utcnow() + timedelta(minutes=5)}
+
+    token = codec.encode(dict(claims))
+
+    assert token == jwt.encode(dict(claims), "secret", algorithm="HS256")
+    assert codec.decode(token) == jwt.decode(token, "secret", algorithms=["HS256"])
+
+
+def test_fast_codec_rejects_what_jose_rejects():
+    """Test tampered, foreign-algorithm and audience-bound tokens are invalid"""
+    jwt_service = JWTService()
+    secret = jwt_service.secret_key
+    token = jwt_service.create_access_token({"sub": "user123"})
+    header, payload, signature = token.split(".")
+
+    invalid = [
+        f"{header}.{payload}.{signature[:-2]}AA",
+        f"{header}.{jwt.encode({'sub': 'admin'}, secret).split('.')[1]}.{signature}",
+        jwt.encode({"sub": "user123"}, secret, algorithm="HS512"),
+        jwt.encode({"sub": "user123", "aud": "other"}, secret),
+        jwt.encode({"sub": "user123", "exp": datetime.utcnow() - timedelta(minutes=1)}, secret),
+        "not-a-token",
+    ]
+    for value in invalid:
+        assert jwt_service.decode_token(value) is None
+
+
+def make_keys(algorithm):
+    if algorithm == "EdDSA":
+        return ed25519.Ed25519PrivateKey.generate(), ed25519.Ed25519PrivateKey.generate()
+    return ec.generate_private_key(ec.SECP256R1()), ec.generate_private_key(ec.SECP256R1())
+
+
+@pytest.mark.parametrize("algorithm", ["EdDSA", "ES256"])
+def test_asymmetric_codec_key_rotation(algorithm):
+    """Test tokens carry the active kid and still verify after rotating to a new key"""
+    old_key, new_key = make_keys(algorithm)
+    old_codec = AsymmetricCodec(algorithm, {"old": old_key})
+    token = old_codec.encode({"sub": "user123", "exp": datetime.utcnow() + timedelta(minutes=5)})
+
+    # The retired key is kept as a public key only
+    rotated = AsymmetricCodec(
+        algorithm, {"old": old_key.public_key(), "new": new_key}, active_kid="new"
+    )
+
+    assert jwt.get_unverified_header(token)["kid"] == "old"
+    assert rotated.decode(token)["sub"] == "user123"
+    assert jwt.get_unverified_header(rotated.encode({"sub": "user123"}))["kid"] == "new"
+    assert [key["kid"] for key in rotated.jwks()["keys"]] == ["old", "new"]
+    with pytest.raises(JWTError):
+        AsymmetricCodec(algorithm, {"new": new_key}).decode(token)
+    with pytest.raises(ValueError):
+        AsymmetricCodec(algorithm, {"old": old_key.public_key()})
+
+
+def test_es256_tokens_verify_with_published_jwks():
+    """Test a third party can verify tokens using only the JWKS"""
+    key, _ = make_keys("ES256")
+    codec = AsymmetricCodec("ES256", {"k1": key})
+    token = codec.encode({"sub": "user123"})
+
+    jwk = codec.jwks()["keys"][0]
+
+    assert jwt.decode(token, jwk, algorithms=["ES256"]) == {"sub": "user123"}
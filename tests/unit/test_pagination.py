@@ -0,0 +1,53 @@
+import pytest
+from datetime import datetime
+from src.application.pagination import encode_cursor, decode_cursor
+from src.application.use_cases.get_user import GetUserUseCase
+from src.domain.entities.user import User
+from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+
+
+def test_cursor_round_trip():
+    """Test a cursor decodes back to the keyset it was built from"""
+    keyset = (datetime(2025, 11, 14, 12, 30, 5), "550e8400-e29b-41d4-a716-446655440000")
+
+    cursor = encode_cursor(keyset)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == keyset
+
+
+def test_decode_invalid_cursor():
+    """Test malformed cursors are rejected"""
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+async def test_pages_walk_users_sharing_created_at(db_session):
+    """Test keyset pages break created_at ties by id and the last page has no cursor"""
+    repository = UserRepositoryImpl(db_session)
+    # One multi-row insert stamps every row with the same created_at
+    result = await repository.create_many(
+        [User(email=f"user{i}@example.com", username=f"user{i}") for i in range(5)]
+    )
+    assert len({user.created_at for user in result.created}) == 1
+    use_case = GetUserUseCase(repository)
+
+    pages, cursor = [], None
+    while True:
+        page = await use_case.get_page(limit=2, cursor=cursor)
+        pages.append([user.id for user in page.items])
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert [len(ids) for ids in pages] == [2, 2, 1]
+    assert [user_id for ids in pages for user_id in ids] == sorted(u.id for u in result.created)
+    assert (await use_case.get_page(limit=5)).next_cursor is None
+
+
+async def test_get_page_rejects_bad_cursor(db_session):
+    """Test a malformed cursor is refused before querying"""
+    use_case = GetUserUseCase(UserRepositoryImpl(db_session))
+
+    with pytest.raises(ValueError):
+        await use_case.get_page(limit=2, cursor="not-a-cursor")
@@ -1,5 +1,11 @@
+import asyncio
+import threading
 import pytest
-from src.infrastructure.services.password_service import PasswordService
+from src.infrastructure.services.password_service import (
+    PasswordHashingBusy,
+    PasswordHashPool,
+    PasswordService,
+)
 
 
 def test_password_hashing():
@@ -50,3 +56,47 @@ def test_different_hashes_for_same_password():
     # But both should verify correctly
     assert password_service.verify_password(plain_password, hash1) is True
     assert password_service.verify_password(plain_password, hash2) is True
+
+
+async def test_async_verification_runs_off_the_event_loop():
+    """Test the event loop keeps running while a hash is computed, with matching results"""
+    pool = PasswordHashPool(max_workers=2, max_queue=2)
+    password_service = PasswordService(pool=pool)
+    ticks = 0
+
+    async def tick_until(task):
+        nonlocal ticks
+        while not task.done():
+            ticks += 1
+            await asyncio.sleep(0.001)
+
+    hashing = asyncio.ensure_future(password_service.hash_password_async("SecurePassword123!"))
+    await tick_until(hashing)
+    hashed = hashing.result()
+
+    # A blocking hash would have starved the ticker until it finished
+    assert ticks > 1
+    assert await password_service.verify_password_async("SecurePassword123!", hashed) is True
+    assert await password_service.verify_password_async("WrongPassword", hashed) is False
+    assert pool.stats()["completed"] == 3
+    pool.shutdown()
+
+
+async def test_hash_pool_rejects_when_saturated():
+    """Test calls beyond the worker and queue limits fail fast instead of queueing"""
+    pool = PasswordHashPool(max_workers=1, max_queue=1)
+    release = threading.Event()
+    running = [asyncio.ensure_future(pool.run(release.wait)) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    with pytest.raises(PasswordHashingBusy):
+        await pool.run(release.wait)
+
+    release.set()
+    await asyncio.gather(*running)
+    await asyncio.sleep(0)
+
+    assert pool.stats()["pending"] == 0
+    assert pool.stats()["rejected"] == 1
+    assert await pool.run(lambda: "free again") == "free again"
+    pool.shutdown()
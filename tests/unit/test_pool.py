@@ -0,0 +1,64 @@
+import httpx
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import create_async_engine
+from src.core.config import settings
+from src.infrastructure.database.pool import InstrumentedAsyncQueuePool, get_pool_status
+from src.infrastructure.database.session import warm_up_pool
+from src.main import app
+
+
+def make_engine(tmp_path, pool_size: int):
+    return create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=pool_size,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+
+
+async def test_pool_counts_checkouts_and_timeouts(tmp_path):
+    """Test a saturated pool records the timed-out waiter alongside successful checkouts"""
+    engine = make_engine(tmp_path, pool_size=1)
+
+    async with engine.connect():
+        with pytest.raises(exc.TimeoutError):
+            async with engine.connect():
+                pass
+        status = get_pool_status(engine)
+
+    assert status["pool_class"] == "InstrumentedAsyncQueuePool"
+    assert (status["checkouts"], status["timeouts"], status["waiting"]) == (1, 1, 0)
+    assert status["checked_out"] == 1
+    assert status["max_wait_ms"] >= status["avg_wait_ms"] >= 0
+    await engine.dispose()
+
+
+async def test_warm_up_opens_connections_up_to_pool_size(tmp_path, monkeypatch):
+    """Test warm-up leaves the requested number of idle connections, capped at the pool size"""
+    monkeypatch.setattr(settings, "DB_POOL_ENABLED", True)
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 3)
+    engine = make_engine(tmp_path, pool_size=3)
+
+    await warm_up_pool(engine, 2)
+    assert get_pool_status(engine)["checked_in"] == 2
+
+    await warm_up_pool(engine, 10)
+    assert get_pool_status(engine)["checked_in"] == 3
+    assert get_pool_status(engine)["checked_out"] == 0
+    await engine.dispose()
+
+
+async def test_db_health_reports_pool_statistics():
+    """Test /health/db returns the writer pool, replicas and per-route query stats"""
+    async with httpx.AsyncClient(app=app, base_url="http://test") as http:
+        response = await http.get("/health/db")
+
+    payload = response.json()
+    assert response.status_code == 200
+    assert payload["status"] == "healthy"
+    assert payload["pool"]["pool_class"] == "InstrumentedAsyncQueuePool"
+    assert {"size", "checked_out", "waiting", "timeouts", "avg_wait_ms"} <= set(payload["pool"])
+    assert payload["replicas"] == []
+    assert isinstance(payload["queries"], dict)
@@ -0,0 +1,71 @@
+import httpx
+import pytest
+from types import SimpleNamespace
+from fastapi import FastAPI
+from src.core.config import settings
+from src.infrastructure.database import instrumentation
+from src.infrastructure.database.instrumentation import (
+    QueryBudgetExceeded,
+    count_queries,
+    query_budget,
+)
+from src.presentation.middleware import QueryStatsMiddleware
+
+
+def execute(statement: str, parameters=()):
+    """Simulate the engine events fired around one cursor execution"""
+    conn = SimpleNamespace(info={})
+    instrumentation._before_cursor_execute(conn, None, statement, parameters, None, False)
+    instrumentation._after_cursor_execute(conn, None, statement, parameters, None, False)
+
+
+def test_count_queries():
+    """Test statements are counted inside the block only"""
+    execute("SELECT 1")
+
+    with count_queries() as stats:
+        execute("SELECT 1")
+        execute("SELECT 2")
+
+    assert stats.count == 2
+    assert stats.statements == ["SELECT 1", "SELECT 2"]
+
+
+def test_query_budget_exceeded():
+    """Test exceeding a query budget fails"""
+    with pytest.raises(QueryBudgetExceeded):
+        with query_budget(1):
+            execute("SELECT 1")
+            execute("SELECT 2")
+
+
+def test_slow_query_log_redacts_parameters(caplog, monkeypatch):
+    """Test slow query logs never include parameter values"""
+    monkeypatch.setattr(settings, "DB_SLOW_QUERY_MS", 0.0)
+
+    execute("SELECT * FROM users WHERE email = %s", ("secret@example.com",))
+
+    assert "Slow query" in caplog.text
+    assert "secret@example.com" not in caplog.text
+    assert "(str)" in caplog.text
+
+
+@pytest.mark.parametrize("expose_headers", [False, True])
+async def test_query_headers_only_when_enabled(expose_headers):
+    """Test per-request query headers are opt-in while route stats are always recorded"""
+
+    app = FastAPI()
+
+    @app.get("/probe")
+    async def probe():
+        execute("SELECT 1")
+        return "ok"
+
+    app.add_middleware(QueryStatsMiddleware, expose_headers=expose_headers)
+    async with httpx.AsyncClient(app=app, base_url="http://test") as http:
+        response = await http.get("/probe")
+
+    assert ("x-db-query-count" in response.headers) is expose_headers
+    if expose_headers:
+        assert response.headers["x-db-query-count"] == "1"
+    assert instrumentation.get_route_stats()["GET /probe"]["queries"] >= 1
@@ -0,0 +1,70 @@
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import create_async_engine
+from src.infrastructure.database.models import UserModel
+from src.infrastructure.database.routing import ReadOnlySessionError, RoutingSessionFactory
+from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+
+
+def make_engine(host: str):
+    return create_async_engine(f"mysql+aiomysql://user:password@{host}:3306/app_db")
+
+
+def test_reader_uses_writer_without_replicas():
+    """Test reads go to the primary, in autocommit on the writer's own pool, without replicas"""
+    writer = make_engine("primary")
+    factory = RoutingSessionFactory(writer)
+
+    session = factory.reader_session()
+
+    assert session.bind.pool is writer.pool
+    assert session.bind.get_execution_options()["isolation_level"] == "AUTOCOMMIT"
+
+
+def test_reader_round_robins_replicas():
+    """Test reads are spread across replicas"""
+    replicas = [make_engine("replica1"), make_engine("replica2")]
+    factory = RoutingSessionFactory(make_engine("primary"), replicas)
+
+    binds = [factory.reader_session().bind for _ in range(4)]
+
+    assert binds == [replicas[0], replicas[1], replicas[0], replicas[1]]
+
+
+def test_reader_skips_lagging_replica():
+    """Test replicas behind the lag threshold are skipped"""
+    writer = make_engine("primary")
+    replicas = [make_engine("replica1"), make_engine("replica2")]
+    factory = RoutingSessionFactory(writer, replicas, max_lag_seconds=5.0)
+
+    factory._replica_lag = {0: 30.0, 1: None}
+
+    assert factory.healthy_replicas() == []
+    assert factory.reader_session().bind.pool is writer.pool
+
+
+def test_repository_reads_own_writes():
+    """Test repository reads switch to the primary after a write"""
+    factory = RoutingSessionFactory(make_engine("primary"), [make_engine("replica1")])
+    session = factory.writer_session()
+    read_session = factory.reader_session()
+    repository = UserRepositoryImpl(session, read_session=read_session)
+
+    assert repository._reader is read_session
+
+    repository._mark_write()
+
+    assert repository._reader is session
+
+
+async def test_reader_session_rejects_writes():
+    """Test write statements on a read-only session are flagged"""
+    factory = RoutingSessionFactory(make_engine("primary"), [make_engine("replica1")])
+    session = factory.reader_session()
+
+    with pytest.raises(ReadOnlySessionError):
+        await session.execute(delete(UserModel).where(UserModel.id == "user123"))
+
+    session.add(UserModel(email="test@example.com", username="test", full_name="Test"))
+    with pytest.raises(ReadOnlySessionError):
+        await session.flush()
@@ -0,0 +1,47 @@
+import asyncio
+import pytest
+from src.infrastructure.cache.single_flight import SingleFlight
+
+
+async def test_concurrent_calls_share_one_execution():
+    """Test identical in-flight calls run once and callers get independent copies"""
+    single_flight = SingleFlight()
+    executions = 0
+
+    async def lookup():
+        nonlocal executions
+        executions += 1
+        await asyncio.sleep(0.01)
+        return {"id": "user123"}
+
+    results = await asyncio.gather(
+        *(single_flight.do(("get_by_id", "user123"), lookup) for _ in range(5))
+    )
+
+    assert executions == 1
+    assert single_flight.coalesced == 4
+    assert all(result == {"id": "user123"} for result in results)
+    assert len({id(result) for result in results}) == 5
+
+
+async def test_waiters_take_over_when_leader_is_cancelled():
+    """Test a cancelled leader does not fail the callers waiting on it"""
+    single_flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def slow_lookup():
+        started.set()
+        await asyncio.sleep(10)
+
+    async def fast_lookup():
+        return "user"
+
+    leader = asyncio.create_task(single_flight.do("key", slow_lookup))
+    await started.wait()
+    follower = asyncio.create_task(single_flight.do("key", fast_lookup))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == "user"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
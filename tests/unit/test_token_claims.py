@@ -0,0 +1,99 @@
+import asyncio
+import time
+from datetime import datetime
+from sqlalchemy import text
+from src.application.token_claims import summary_from_claims, user_claims
+from src.domain.entities.user import User
+from src.infrastructure.services.jwt_service import JWTService
+from src.infrastructure.services.token_revocation_service import TokenRevocationService
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+
+def make_user() -> User:
+    return User(
+        id="0190a8a0-1d2c-7b3e-8f00-0123456789ab",
+        email="test@example.com",
+        username="testuser",
+        full_name="Test User",
+        auth_provider="local",
+        is_active=True,
+        is_verified=True,
+        created_at=datetime(2024, 1, 1, 12, 0, 0, 123456),
+        updated_at=datetime(2024, 2, 1, 8, 30, 0, 654321),
+    )
+
+
+def test_summary_round_trips_through_access_token():
+    """Test the authenticated user can be rebuilt from a verified access token"""
+    user = make_user()
+    jwt_service = JWTService()
+    payload = jwt_service.verify_token(jwt_service.create_access_token(user_claims(user)))
+
+    summary = summary_from_claims(payload)
+
+    assert summary is not None
+    assert summary.id == user.id
+    assert summary.email == user.email
+    assert summary.full_name == user.full_name
+    assert summary.is_verified is True
+    assert summary.created_at == user.created_at
+    assert summary.updated_at == user.updated_at
+
+
+def test_legacy_token_claims_require_lookup():
+    """Test tokens without profile claims fall back to a database lookup"""
+    payload = {"sub": "user123", "email": "test@example.com", "username": "testuser"}
+
+    assert summary_from_claims(payload) is None
+
+
+async def test_revocation_rejects_tokens_issued_up_to_the_change():
+    """Test tokens issued before or at a revoking change are rejected and later ones accepted"""
+    user = make_user()
+    revocation = TokenRevocationService(FakeRedis(), ttl_seconds=1800)
+    issued_at = time.time()
+
+    assert not await revocation.is_revoked(user.id, issued_at)
+
+    await revocation.revoke_user(user.id)
+    revoked_at = float(revocation.redis.data[f"auth:revoked:{user.id}"])
+
+    assert await revocation.is_revoked(user.id, issued_at)
+    assert await revocation.is_revoked(user.id, revoked_at)
+    assert not await revocation.is_revoked(user.id, revoked_at + 0.001)
+    assert not await revocation.is_revoked("other-user", issued_at)
+
+
+async def test_revocation_waits_for_commit(db_session):
+    """Test a revocation inside a transaction is recorded only once it commits"""
+    redis = FakeRedis()
+    revocation = TokenRevocationService(redis, ttl_seconds=1800, session=db_session)
+    await db_session.execute(text("SELECT 1"))
+
+    await revocation.revoke_user("user123")
+    issued_before_commit = time.time()
+    assert redis.data == {}
+
+    await db_session.commit()
+    await asyncio.gather(*TokenRevocationService._pending_revocations)
+
+    assert await revocation.is_revoked("user123", issued_before_commit)
+
+
+def test_access_tokens_carry_subsecond_iat():
+    """Test access tokens record when they were issued, below one-second resolution"""
+    jwt_service = JWTService()
+    before = time.time()
+    payload = jwt_service.verify_token(jwt_service.create_access_token({"sub": "user123"}))
+
+    assert before <= payload["iat"] <= time.time()
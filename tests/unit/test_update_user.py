@@ -0,0 +1,54 @@
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock
+from src.application.use_cases.update_user import UpdateUserUseCase
+from src.domain.entities.user import User
+from src.domain.repositories.user_repository import UserRepository
+
+UPDATED_AT = datetime(2024, 2, 1, 8, 30)
+
+
+def make_repository() -> AsyncMock:
+    repository = AsyncMock(spec=UserRepository)
+    repository.get_by_id.return_value = User(
+        id="user123", email="test@example.com", username="testuser", full_name="Test User"
+    )
+    repository.get_by_email.return_value = None
+    repository.get_by_username.return_value = None
+    repository.update_fields.return_value = UPDATED_AT
+    return repository
+
+
+async def test_update_builds_result_without_reading_back():
+    """Test only changed columns are written and the result comes from known values"""
+    repository = make_repository()
+
+    user = await UpdateUserUseCase(repository).execute(
+        "user123", {"full_name": "New Name", "username": "testuser"}
+    )
+
+    repository.update_fields.assert_awaited_once_with("user123", {"full_name": "New Name"})
+    assert repository.get_by_id.await_count == 1
+    assert user.full_name == "New Name"
+    assert user.updated_at == UPDATED_AT
+
+
+async def test_update_rejects_nulls_and_taken_username():
+    """Test null values and usernames owned by another user are rejected before writing"""
+    repository = make_repository()
+    repository.get_by_username.return_value = User(id="other", username="taken")
+    use_case = UpdateUserUseCase(repository)
+
+    with pytest.raises(ValueError, match="cannot be null"):
+        await use_case.execute("user123", {"email": None})
+    with pytest.raises(ValueError, match="already exists"):
+        await use_case.execute("user123", {"username": "taken"})
+    repository.update_fields.assert_not_awaited()
+
+
+async def test_update_returns_none_when_row_is_gone():
+    """Test a user deleted before the UPDATE (rowcount 0) is reported as not found"""
+    repository = make_repository()
+    repository.update_fields.return_value = None
+
+    assert await UpdateUserUseCase(repository).execute("user123", {"full_name": "X"}) is None
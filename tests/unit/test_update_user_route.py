@@ -0,0 +1,106 @@
+import asyncio
+import httpx
+import pytest
+from src.application.token_claims import user_claims
+from src.core.auth_dependencies import get_current_user
+from src.core.config import settings
+from src.core.dependencies import get_db, get_read_db
+from src.domain.entities.user import User, UserSummary
+from src.infrastructure.cache import redis_client
+from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+from src.infrastructure.services.jwt_service import JWTService
+from src.infrastructure.services.token_revocation_service import TokenRevocationService
+from src.main import app
+
+
+@pytest.fixture
+async def client(db_session):
+    repository = UserRepositoryImpl(db_session)
+    alice = await repository.create(User(email="alice@example.com", username="alice"))
+    bob = await repository.create(User(email="bob@example.com", username="bob"))
+    current = {"user": UserSummary.from_user(alice)}
+
+    async def session():
+        yield db_session
+
+    app.dependency_overrides[get_db] = session
+    app.dependency_overrides[get_read_db] = session
+    app.dependency_overrides[get_current_user] = lambda: current["user"]
+    async with httpx.AsyncClient(app=app, base_url="http://test") as http:
+        yield http, alice, bob
+    app.dependency_overrides.clear()
+
+
+async def test_patch_requires_authentication():
+    """Test anonymous callers cannot update users"""
+    async with httpx.AsyncClient(app=app, base_url="http://test") as http:
+        response = await http.patch("/api/v1/users/some-id", json={"is_active": False})
+
+    assert response.status_code == 403
+
+
+async def test_bulk_create_requires_authentication():
+    """Test anonymous callers cannot bulk-create users"""
+    async with httpx.AsyncClient(app=app, base_url="http://test") as http:
+        response = await http.post("/api/v1/users/bulk", json={"users": []})
+
+    assert response.status_code == 403
+
+
+async def test_patch_only_updates_own_account(client):
+    """Test users can update themselves but not others, and invalid changes return 400"""
+    http, alice, bob = client
+
+    other = await http.patch(f"/api/v1/users/{bob.id}", json={"is_active": False})
+    own = await http.patch(f"/api/v1/users/{alice.id}", json={"full_name": "Alice Smith"})
+    null_email = await http.patch(f"/api/v1/users/{alice.id}", json={"email": None})
+    taken = await http.patch(f"/api/v1/users/{alice.id}", json={"username": "bob"})
+
+    assert other.status_code == 403
+    assert own.status_code == 200
+    assert own.json()["full_name"] == "Alice Smith"
+    assert null_email.status_code == 400
+    assert taken.status_code == 400
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+
+async def test_profile_change_revokes_stateless_tokens(db_session, monkeypatch):
+    """Test /auth/me cannot keep serving the old profile from a token after a PATCH"""
+    monkeypatch.setattr(settings, "AUTH_STATELESS_ENABLED", True)
+    monkeypatch.setattr(redis_client, "redis_client", FakeRedis())
+    alice = await UserRepositoryImpl(db_session).create(
+        User(email="alice@example.com", username="alice")
+    )
+    await db_session.commit()
+    headers = {"Authorization": f"Bearer {JWTService().create_access_token(user_claims(alice))}"}
+
+    async def session():
+        yield db_session
+        await db_session.commit()
+
+    app.dependency_overrides[get_db] = session
+    app.dependency_overrides[get_read_db] = session
+    try:
+        async with httpx.AsyncClient(app=app, base_url="http://test") as http:
+            before = await http.get("/api/v1/auth/me", headers=headers)
+            patched = await http.patch(
+                f"/api/v1/users/{alice.id}", json={"username": "alice2"}, headers=headers
+            )
+            await asyncio.gather(*TokenRevocationService._pending_revocations)
+            after = await http.get("/api/v1/auth/me", headers=headers)
+    finally:
+        app.dependency_overrides.clear()
+
+    assert before.json()["username"] == "alice"
+    assert patched.status_code == 200
+    assert after.status_code == 401
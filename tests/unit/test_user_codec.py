@@ -0,0 +1,39 @@
+import pytest
+from datetime import datetime
+from src.domain.entities.user import User
+from src.infrastructure.cache.user_codec import UnsupportedCodecVersion, decode_user, encode_user
+
+
+def test_round_trip_preserves_every_field():
+    """Test a fully populated user survives encoding unchanged"""
+    user = User(
+        id="0190b2a4-7f3e-7c1a-9d2e-3b4c5d6e7f80",
+        email="tést@example.com",
+        username="testuser",
+        full_name="Test User",
+        password_hash="$2b$12$abcdefghijklmnopqrstuv",
+        auth_provider="google",
+        oauth_provider_id="1234567890",
+        is_active=False,
+        is_verified=True,
+        created_at=datetime(2024, 1, 1, 12, 0, 0, 123456),
+        updated_at=datetime(2024, 6, 1, 8, 30, 0),
+    )
+
+    assert decode_user(encode_user(user)) == user
+
+
+def test_round_trip_non_uuid_id_and_missing_optionals():
+    """Test ids that are not canonical UUIDs and unset optional fields are kept as-is"""
+    user = User(id="user123", email="a@example.com", username="a", full_name="A")
+
+    assert decode_user(encode_user(user)) == user
+
+
+def test_unknown_version_is_rejected():
+    """Test payloads from another codec version are refused rather than misread"""
+    payload = bytearray(encode_user(User(id="user123", email="a@example.com")))
+    payload[0] = 99
+
+    with pytest.raises(UnsupportedCodecVersion):
+        decode_user(bytes(payload))
@@ -0,0 +1,27 @@
+from unittest.mock import AsyncMock
+from src.application.use_cases.get_user import GetUserUseCase
+from src.domain.entities.user import User
+from src.domain.repositories.user_repository import UserRepository
+
+USER_ID = "0190b2a4-7f3e-7c1a-9d2e-3b4c5d6e7f80"
+
+
+async def test_get_many_reports_missing_ids_and_emails():
+    """Test a batch lookup returns each user once and lists keys that matched nobody"""
+    user = User(id=USER_ID, email="a@example.com", username="alice", full_name="Alice")
+    repository = AsyncMock(spec=UserRepository)
+    repository.get_many_by_ids.return_value = [user]
+    repository.get_many_by_emails.return_value = [user]
+    use_case = GetUserUseCase(repository)
+
+    result = await use_case.get_many(
+        user_ids=[USER_ID.upper(), "not-a-uuid", "0190b2a4-0000-7000-8000-000000000000"],
+        emails=["A@example.com", "b@example.com"],
+    )
+
+    assert result.users == [user]
+    assert result.missing_ids == ["not-a-uuid", "0190b2a4-0000-7000-8000-000000000000"]
+    assert result.missing_emails == ["b@example.com"]
+    repository.get_many_by_ids.assert_awaited_once_with(
+        [USER_ID, "0190b2a4-0000-7000-8000-000000000000"]
+    )
@@ -0,0 +1,76 @@
+from src.domain.entities.user import User
+from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+
+MISSING_ID = "0190a8a0-1d2c-7b3e-8f00-0123456789ab"
+
+
+def make_user(username: str) -> User:
+    return User(email=f"{username}@example.com", username=username, full_name="Test User")
+
+
+async def test_update_fields_returns_stored_updated_at(db_session):
+    """Test a partial update returns the new updated_at as stored, or None for unknown users"""
+    repository = UserRepositoryImpl(db_session)
+    user = await repository.create(make_user("alice"))
+
+    updated_at = await repository.update_fields(user.id, {"full_name": "Alice Smith"})
+    reloaded = await repository.get_by_id(user.id)
+
+    assert user.created_at.microsecond == 0
+    assert updated_at == reloaded.updated_at
+    assert reloaded.full_name == "Alice Smith"
+    assert await repository.update_fields(MISSING_ID, {"full_name": "Nobody"}) is None
+
+
+async def test_next_available_username_returns_prefix_when_free(db_session):
+    """Test the bare prefix is returned when no username starts with it, or only longer ones do"""
+    repository = UserRepositoryImpl(db_session)
+    assert await repository.next_available_username("mary") == "mary"
+
+    await repository.create(make_user("maryann"))
+    assert await repository.next_available_username("mary") == "mary"
+
+
+async def test_next_available_username_numbers_after_highest_suffix(db_session):
+    """Test gaps are not reused and non-numeric suffixes are ignored"""
+    repository = UserRepositoryImpl(db_session)
+    for username in ["john", "john1", "john3", "johnx", "john2a", "johnny"]:
+        await repository.create(make_user(username))
+
+    assert await repository.next_available_username("john") == "john4"
+
+
+async def test_next_available_username_without_numeric_suffixes(db_session):
+    """Test numbering starts at 1 when only the bare prefix and non-numeric variants exist"""
+    repository = UserRepositoryImpl(db_session)
+    for username in ["jo_n", "jo_nny", "joxn7"]:
+        await repository.create(make_user(username))
+
+    # "_" is matched literally, so joxn7 does not count as a suffix of jo_n
+    assert await repository.next_available_username("jo_n") == "jo_n1"
+
+
+async def test_get_summary_by_id(db_session):
+    """Test the summary carries the public fields, and is None for unknown users"""
+    repository = UserRepositoryImpl(db_session)
+    user = await repository.create(make_user("bob"))
+
+    summary = await repository.get_summary_by_id(user.id)
+
+    assert (summary.id, summary.email, summary.username) == (user.id, user.email, "bob")
+    assert summary.is_active is True
+    assert await repository.get_summary_by_id(MISSING_ID) is None
+
+
+async def test_create_many_reports_conflicts(db_session):
+    """Test existing and in-chunk duplicates become conflicts while the other rows are inserted"""
+    repository = UserRepositoryImpl(db_session)
+    await repository.create(make_user("taken"))
+    users = [make_user("ann"), make_user("taken"), make_user("bea"), make_user("ann")]
+
+    # The in-chunk duplicate only surfaces as an IntegrityError, retried row by row
+    result = await repository.create_many(users, chunk_size=10)
+
+    assert sorted(user.username for user in result.created) == ["ann", "bea"]
+    assert sorted(index for index, _ in result.conflicts) == [1, 3]
+    assert (await repository.get_by_username("bea")).email == "bea@example.com"